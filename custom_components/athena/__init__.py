@@ -10,11 +10,23 @@ from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.typing import ConfigType
 
-from .const import DOMAIN
+from .const import (
+    DEFAULT_TIMEOUT,
+    DOMAIN,
+    PARK_TIMEOUT,
+    PARKED_COORDINATORS,
+    PENDING_CLIENTS,
+)
 from .coordinator import AthenaDataUpdateCoordinator
+from .reconcile import desired_store
+from .services import async_setup_services
+from .websocket import async_register_websocket_commands
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -26,36 +38,119 @@ PLATFORMS: list[Platform] = [
     Platform.BINARY_SENSOR,
 ]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Athena integration."""
+    async_setup_services(hass)
+    async_register_websocket_commands(hass)
+    return True
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Athena from a config entry."""
     _LOGGER.debug("Setting up Athena integration")
-    
-    coordinator = AthenaDataUpdateCoordinator(hass, entry)
-    
-    try:
-        await coordinator.async_config_entry_first_refresh()
-    except Exception as ex:
-        _LOGGER.error("Error setting up Athena: %s", ex)
-        raise ConfigEntryNotReady from ex
-    
+
+    # Reuse the client the config flow just validated, or the client and
+    # snapshot from before a reload, instead of reconnecting.
+    api = device_info = previous = None
+    parked = _async_take_parked(hass, entry)
+    if pending := hass.data.get(PENDING_CLIENTS, {}).pop(entry.unique_id, None):
+        api, device_info = pending
+        api.timeout = DEFAULT_TIMEOUT
+    elif parked is not None and parked.matches(entry):
+        previous = parked
+        api, device_info = previous.api, previous.device_info
+
+    coordinator = AthenaDataUpdateCoordinator(hass, entry, api, device_info)
+    if previous is not None:
+        coordinator.async_adopt(previous)
+    else:
+        if parked is not None:
+            # Connection settings changed, a fresh client is needed. The new
+            # reconciler loads the desired state, so write it out first.
+            # Websocket subscribers stay attached either way.
+            coordinator.async_take_observers(parked)
+            await parked.reconciler.async_flush()
+            await parked.api.close()
+        await coordinator.reconciler.async_load()
+
+    if coordinator.data is None:
+        try:
+            await coordinator.async_config_entry_first_refresh()
+        except Exception as ex:
+            _LOGGER.error("Error setting up Athena: %s", ex)
+            await coordinator.api.close()
+            raise ConfigEntryNotReady from ex
+
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
-    
+
+    entry.async_on_unload(coordinator.async_start_heartbeat())
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-    
+
     return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
-    
+        coordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        if hass.is_stopping:
+            await coordinator.api.close()
+        else:
+            _async_park(hass, entry.entry_id, coordinator)
+
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the stored desired configuration of a removed entry."""
+    parked = hass.data.get(PARKED_COORDINATORS, {}).pop(entry.entry_id, None)
+    if parked is None:
+        await desired_store(hass, entry.entry_id).async_remove()
+        return
+    # The unload just parked it; its store may still have a save pending
+    coordinator, cancel_expire = parked
+    cancel_expire()
+    await coordinator.reconciler.async_remove()
+    await coordinator.api.close()
+
+
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Reload config entry."""
-    await async_unload_entry(hass, entry)
-    await async_setup_entry(hass, entry)
+    """Reload config entry.
+
+    The unloaded coordinator is parked and picked up again by setup, so the
+    client, its connections and the last snapshot survive the reload.
+    """
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
+@callback
+def _async_park(
+    hass: HomeAssistant, entry_id: str, coordinator: AthenaDataUpdateCoordinator
+) -> None:
+    """Keep an unloaded coordinator around briefly in case the entry is set up again."""
+    parked = hass.data.setdefault(PARKED_COORDINATORS, {})
+
+    async def _async_expire(_now: Any) -> None:
+        if parked.get(entry_id, (None,))[0] is coordinator:
+            parked.pop(entry_id)
+            await coordinator.api.close()
+
+    parked[entry_id] = (coordinator, async_call_later(hass, PARK_TIMEOUT, _async_expire))
+
+
+@callback
+def _async_take_parked(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> AthenaDataUpdateCoordinator | None:
+    """Return the parked coordinator for an entry, if there is one."""
+    if (parked := hass.data.get(PARKED_COORDINATORS, {}).pop(entry.entry_id, None)) is None:
+        return None
+    coordinator, cancel_expire = parked
+    cancel_expire()
+    return coordinator
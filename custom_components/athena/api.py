@@ -4,14 +4,93 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
-from typing import Any, Dict, Optional
+import time
+import weakref
+from typing import TYPE_CHECKING, Any, Collection, Dict, List, Optional, Tuple
 
 import aiohttp
 
-from .const import DEFAULT_TIMEOUT
+from .auth import AthenaAuth
+from .const import (
+    CONTENT_TYPE_CBOR,
+    CONTENT_TYPE_JSON,
+    CONTENT_TYPE_MSGPACK,
+    CONTENT_TYPES_MSGPACK,
+    DEFAULT_RATE_BURST,
+    DEFAULT_RATE_LIMIT,
+    DEFAULT_TIMEOUT,
+    STREAM_CHUNK_SIZE,
+    STREAM_PARSE_THRESHOLD,
+)
+from .errorlog import AthenaErrorLog
+from .limiter import AthenaRateLimiter
+
+# All three are manifest requirements; the guards keep installs that skip
+# requirements (skip_pip) working on buffered JSON alone.
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import cbor2
+except ImportError:
+    cbor2 = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+if TYPE_CHECKING:
+    from .capture import AthenaTrafficRecorder
+    from .profiler import AthenaRefreshProfiler
 
 _LOGGER = logging.getLogger(__name__)
 
+# Every client ever created and not yet garbage collected, for leak hunting
+_CLIENTS: weakref.WeakSet[AthenaAPIClient] = weakref.WeakSet()
+
+
+def _build_accept_header() -> str:
+    """Advertise the encodings we can decode, preferring compact ones.
+
+    Only encodings with an importable decoder are offered, so firmware that
+    honours the header never answers in a format we cannot read. JSON is
+    always accepted as the lowest-priority fallback.
+    """
+    accepted = []
+    if msgpack is not None:
+        accepted.append(CONTENT_TYPE_MSGPACK)
+    if cbor2 is not None:
+        accepted.append(f"{CONTENT_TYPE_CBOR};q=0.9")
+    accepted.append(f"{CONTENT_TYPE_JSON};q=0.5")
+    return ", ".join(accepted)
+
+
+def select_keys(data: Any, keys: Optional[Collection[str]]) -> Any:
+    """Keep only the requested top-level keys of a decoded document."""
+    if keys is None or not isinstance(data, dict):
+        return data
+    return {key: data[key] for key in keys if key in data}
+
+
+def _loads_selected(
+    loads: Any, body: bytes, keys: Optional[Collection[str]]
+) -> Any:
+    """Decode a buffered body and select keys. Runs in the executor."""
+    return select_keys(loads(body), keys)
+
+
+def _unpack_msgpack(body: bytes) -> Any:
+    """Decode a MessagePack body."""
+    return msgpack.unpackb(body, raw=False)
+
+
+def live_clients() -> List[AthenaAPIClient]:
+    """Return all API clients that are still alive."""
+    return list(_CLIENTS)
+
 
 class AthenaAPIClient:
     """API client for communicating with Athena devices."""
@@ -23,6 +102,9 @@ class AthenaAPIClient:
         username: str,
         password: str,
         timeout: int = DEFAULT_TIMEOUT,
+        recorder: Optional[AthenaTrafficRecorder] = None,
+        rate_limit: float = DEFAULT_RATE_LIMIT,
+        rate_burst: int = DEFAULT_RATE_BURST,
     ) -> None:
         """Initialize the API client."""
         self.host = host
@@ -32,156 +114,389 @@ class AthenaAPIClient:
         self.timeout = timeout
         self.base_url = f"http://{host}:{port}"
         self._session: Optional[aiohttp.ClientSession] = None
+        self.limiter = AthenaRateLimiter(rate_limit, rate_burst)
+        self._auth = AthenaAuth(username, password, self.limiter)
+        self.recorder = recorder
+        self.profiler: Optional[AthenaRefreshProfiler] = None
+        self.errors = AthenaErrorLog(_LOGGER, host)
+        _CLIENTS.add(self)
+
+    @property
+    def session_open(self) -> bool:
+        """Return True if the client holds an open aiohttp session."""
+        return self._session is not None and not self._session.closed
 
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create an aiohttp session."""
         if self._session is None or self._session.closed:
             timeout = aiohttp.ClientTimeout(total=self.timeout)
-            auth = aiohttp.BasicAuth(self.username, self.password)
             self._session = aiohttp.ClientSession(
                 timeout=timeout,
-                auth=auth,
-                headers={"Content-Type": "application/json"},
+                # Devices are usually addressed by IP, which the default jar
+                # refuses to store session cookies for.
+                cookie_jar=aiohttp.CookieJar(unsafe=True),
+                # aiohttp already asks for gzip/deflate and undoes it
+                headers={
+                    "Content-Type": CONTENT_TYPE_JSON,
+                    "Accept": _build_accept_header(),
+                },
             )
+            # Cached cookies died with the old session
+            self._auth.reset()
         return self._session
 
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        payload: Optional[Dict[str, Any]] = None,
+        *,
+        decode: bool = False,
+        keys: Optional[Collection[str]] = None,
+        authenticate: bool = True,
+        timeout: Optional[float] = None,
+    ) -> Tuple[int, Any]:
+        """Send a request and return its status and, if asked, decoded body.
+
+        When ``keys`` is given only those top-level keys of the body are kept.
+        Authenticated requests that are rejected with a 401 re-authenticate
+        and are retried exactly once.
+        """
+        if self.recorder is None:
+            return await self._send(method, path, payload, decode, keys, authenticate, timeout)
+
+        started = time.monotonic()
+        try:
+            status, body = await self._send(
+                method, path, payload, decode, keys, authenticate, timeout
+            )
+        except Exception as ex:
+            self.recorder.record(method, path, started, error=ex)
+            raise
+        self.recorder.record(method, path, started, status, body)
+        return status, body
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        payload: Optional[Dict[str, Any]],
+        decode: bool,
+        keys: Optional[Collection[str]],
+        authenticate: bool,
+        timeout: Optional[float],
+    ) -> Tuple[int, Any]:
+        """Perform the HTTP exchange for _request."""
+        session = await self._get_session()
+        data = json.dumps(payload) if payload is not None else None
+        # Per request, so a client's timeout can change after its session exists
+        request_timeout = aiohttp.ClientTimeout(total=timeout or self.timeout)
+
+        retried = False
+        while True:
+            # Every exchange with the device, retries included, costs a token
+            await self.limiter.acquire()
+            headers: Dict[str, str] = {}
+            auth: Optional[aiohttp.BasicAuth] = None
+            generation = 0
+            if authenticate:
+                headers, auth, generation = await self._auth.async_credentials(
+                    session, self.base_url
+                )
+            async with session.request(
+                method,
+                f"{self.base_url}{path}",
+                data=data,
+                headers=headers,
+                auth=auth,
+                timeout=request_timeout,
+            ) as response:
+                if response.status == 401 and authenticate and not retried:
+                    retried = True
+                    await self._auth.async_reauthenticate(session, self.base_url, generation)
+                    continue
+                body = None
+                if decode and response.status == 200:
+                    if self.profiler is None:
+                        body = await self._decode_response(response, keys)
+                    else:
+                        with self.profiler.phase("decode"):
+                            body = await self._decode_response(response, keys)
+                    if not isinstance(body, dict):
+                        # Callers treat every document as a mapping
+                        _LOGGER.debug("Ignoring non-object body from %s%s", self.host, path)
+                        body = {}
+                return response.status, body
+
+    async def _decode_response(
+        self,
+        response: aiohttp.ClientResponse,
+        keys: Optional[Collection[str]] = None,
+    ) -> Dict[str, Any]:
+        """Decode a response body according to its negotiated content type.
+
+        gzip/deflate transfer encoding is undone by aiohttp before we get here.
+        Anything that is not a compact encoding we can decode is treated as
+        JSON, so older firmware keeps working unchanged.
+
+        Bodies whose decompressed size exceeds STREAM_PARSE_THRESHOLD are
+        decoded in the executor so large documents don't stall the event
+        loop. Content-Length can't tell (it is missing on chunked responses
+        and counts compressed bytes), so the size is measured while reading.
+        """
+        content_type = response.content_type
+        if content_type in CONTENT_TYPES_MSGPACK and msgpack is not None:
+            loads = _unpack_msgpack
+        elif content_type == CONTENT_TYPE_CBOR and cbor2 is not None:
+            loads = cbor2.loads
+        else:
+            return await self._decode_json(response, keys)
+
+        body = await response.read()
+        if len(body) <= STREAM_PARSE_THRESHOLD:
+            return select_keys(loads(body), keys)
+        return await asyncio.get_running_loop().run_in_executor(
+            None, _loads_selected, loads, body, keys
+        )
+
+    async def _decode_json(
+        self,
+        response: aiohttp.ClientResponse,
+        keys: Optional[Collection[str]],
+    ) -> Dict[str, Any]:
+        """Parse small JSON documents inline and hand large ones off.
+
+        Reading stops as soon as the body outgrows STREAM_PARSE_THRESHOLD, so
+        no more than that is buffered before the large-document path takes
+        over.
+        """
+        head: List[bytes] = []
+        size = 0
+        async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+            head.append(chunk)
+            size += len(chunk)
+            if size > STREAM_PARSE_THRESHOLD:
+                return await self._decode_large_json(response, keys, head)
+
+        body = b"".join(head)
+        if not body.strip():
+            return {}
+        return select_keys(json.loads(body), keys)
+
+    async def _decode_large_json(
+        self,
+        response: aiohttp.ClientResponse,
+        keys: Optional[Collection[str]],
+        head: List[bytes],
+    ) -> Dict[str, Any]:
+        """Parse a large JSON document off the event loop.
+
+        ``head`` holds the chunks already read. The parser is fed those and
+        then the rest of the body as it arrives, keeping only the wanted
+        top-level keys, so the full document is never held in memory. Without
+        ijson the remaining body is buffered and parsed in the executor.
+        """
+        loop = asyncio.get_running_loop()
+        if ijson is None:
+            body = b"".join([*head, await response.content.read()])
+            return await loop.run_in_executor(None, _loads_selected, json.loads, body, keys)
+
+        selected: Dict[str, Any] = {}
+        items = ijson.sendable_list()
+        parser = ijson.kvitems_coro(items, "", use_float=True)
+
+        def _collect() -> None:
+            for key, value in items:
+                if keys is None or key in keys:
+                    selected[key] = value
+            del items[:]
+
+        for chunk in head:
+            await loop.run_in_executor(None, parser.send, chunk)
+            _collect()
+        head.clear()
+        async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+            await loop.run_in_executor(None, parser.send, chunk)
+            _collect()
+        await loop.run_in_executor(None, parser.close)
+        _collect()
+        return selected
+
     async def close(self) -> None:
         """Close the aiohttp session."""
+        if self.recorder is not None:
+            await self.recorder.async_flush()
         if self._session and not self._session.closed:
             await self._session.close()
 
     async def test_connection(self) -> bool:
         """Test connection to the device."""
+        return await self.connection_status() == 200
+
+    async def connection_status(self) -> Optional[int]:
+        """Return the status of an authenticated status request.
+
+        None means the device could not be reached at all, 401 that it
+        rejected the credentials.
+        """
         try:
-            session = await self._get_session()
-            async with session.get(f"{self.base_url}/api/status") as response:
-                return response.status == 200
+            status, _ = await self._request("GET", "/api/status")
         except Exception as ex:
-            _LOGGER.error("Connection test failed: %s", ex)
+            self.errors.error("connection test", "Connection test failed: %s", ex)
+            return None
+        self.errors.recovered("connection test")
+        return status
+
+    async def probe(self, timeout: float) -> bool:
+        """Cheap liveness check with a tight timeout.
+
+        Uses an unauthenticated HEAD request so the device neither verifies
+        credentials nor builds a status document; any response at all (even an
+        error status) proves the device is reachable.
+        """
+        try:
+            status, _ = await self._request(
+                "HEAD", "/api/status", authenticate=False, timeout=timeout
+            )
+            return status < 500
+        except (aiohttp.ClientError, asyncio.TimeoutError) as ex:
+            _LOGGER.debug("Heartbeat probe to %s failed: %s", self.host, ex)
             return False
 
     async def get_device_info(self) -> Dict[str, Any]:
         """Get device information."""
         try:
-            session = await self._get_session()
-            async with session.get(f"{self.base_url}/api/info") as response:
-                if response.status == 200:
-                    return await response.json()
-                else:
-                    _LOGGER.error("Failed to get device info: %s", response.status)
-                    return {}
+            status, data = await self._request("GET", "/api/info", decode=True)
+            if status == 200:
+                self.errors.recovered("device info")
+                return data
+            else:
+                self.errors.error("device info", "Failed to get device info: %s", status)
+                return {}
         except Exception as ex:
-            _LOGGER.error("Error getting device info: %s", ex)
+            self.errors.error("device info", "Error getting device info: %s", ex)
             return {}
 
-    async def get_sensor_data(self) -> Dict[str, Any]:
-        """Get current sensor data from the device."""
+    async def get_sensor_data(self, keys: Optional[Collection[str]] = None) -> Dict[str, Any]:
+        """Get current sensor data from the device.
+
+        If ``keys`` is given, only those top-level keys are returned.
+        """
         try:
-            session = await self._get_session()
-            async with session.get(f"{self.base_url}/api/sensors") as response:
-                if response.status == 200:
-                    return await response.json()
-                else:
-                    _LOGGER.error("Failed to get sensor data: %s", response.status)
-                    return {}
+            status, data = await self._request(
+                "GET", "/api/sensors", decode=True, keys=keys
+            )
+            if status == 200:
+                self.errors.recovered("sensor data")
+                return data
+            else:
+                self.errors.error("sensor data", "Failed to get sensor data: %s", status)
+                return {}
         except Exception as ex:
-            _LOGGER.error("Error getting sensor data: %s", ex)
+            self.errors.error("sensor data", "Error getting sensor data: %s", ex)
             return {}
 
     async def get_status(self) -> Dict[str, Any]:
         """Get device status."""
         try:
-            session = await self._get_session()
-            async with session.get(f"{self.base_url}/api/status") as response:
-                if response.status == 200:
-                    return await response.json()
-                else:
-                    _LOGGER.error("Failed to get status: %s", response.status)
-                    return {}
+            status, data = await self._request("GET", "/api/status", decode=True)
+            if status == 200:
+                self.errors.recovered("status")
+                return data
+            else:
+                self.errors.error("status", "Failed to get status: %s", status)
+                return {}
         except Exception as ex:
-            _LOGGER.error("Error getting status: %s", ex)
+            self.errors.error("status", "Error getting status: %s", ex)
             return {}
 
     async def set_power(self, state: bool) -> bool:
         """Set power state."""
         try:
-            session = await self._get_session()
-            data = {"power": state}
-            async with session.post(
-                f"{self.base_url}/api/power",
-                data=json.dumps(data)
-            ) as response:
-                return response.status == 200
+            status, _ = await self._request("POST", "/api/power", {"power": state})
         except Exception as ex:
-            _LOGGER.error("Error setting power: %s", ex)
+            self.errors.error("power", "Error setting power: %s", ex)
             return False
+        if status == 200:
+            self.errors.recovered("power")
+        else:
+            self.errors.error("power", "Failed to set power: %s", status)
+        return status == 200
 
     async def set_auto_mode(self, state: bool) -> bool:
         """Set auto mode state."""
         try:
-            session = await self._get_session()
-            data = {"auto_mode": state}
-            async with session.post(
-                f"{self.base_url}/api/mode",
-                data=json.dumps(data)
-            ) as response:
-                return response.status == 200
+            status, _ = await self._request("POST", "/api/mode", {"auto_mode": state})
         except Exception as ex:
-            _LOGGER.error("Error setting auto mode: %s", ex)
+            self.errors.error("auto mode", "Error setting auto mode: %s", ex)
             return False
+        if status == 200:
+            self.errors.recovered("auto mode")
+        else:
+            self.errors.error("auto mode", "Failed to set auto mode: %s", status)
+        return status == 200
 
     async def set_threshold(self, value: float) -> bool:
         """Set threshold value."""
         try:
-            session = await self._get_session()
-            data = {"threshold": value}
-            async with session.post(
-                f"{self.base_url}/api/config",
-                data=json.dumps(data)
-            ) as response:
-                return response.status == 200
+            status, _ = await self._request("POST", "/api/config", {"threshold": value})
         except Exception as ex:
-            _LOGGER.error("Error setting threshold: %s", ex)
+            self.errors.error("threshold", "Error setting threshold: %s", ex)
             return False
+        if status == 200:
+            self.errors.recovered("threshold")
+        else:
+            self.errors.error("threshold", "Failed to set threshold: %s", status)
+        return status == 200
 
     async def set_interval(self, value: float) -> bool:
         """Set interval value."""
         try:
-            session = await self._get_session()
-            data = {"interval": value}
-            async with session.post(
-                f"{self.base_url}/api/config",
-                data=json.dumps(data)
-            ) as response:
-                return response.status == 200
+            status, _ = await self._request("POST", "/api/config", {"interval": value})
+        except Exception as ex:
+            self.errors.error("interval", "Error setting interval: %s", ex)
+            return False
+        if status == 200:
+            self.errors.recovered("interval")
+        else:
+            self.errors.error("interval", "Failed to set interval: %s", status)
+        return status == 200
+
+    async def set_config(self, values: Dict[str, Any]) -> bool:
+        """Set several configuration keys in one request."""
+        try:
+            status, _ = await self._request("POST", "/api/config", values)
         except Exception as ex:
-            _LOGGER.error("Error setting interval: %s", ex)
+            self.errors.error("config", "Error setting config %s: %s", list(values), ex)
             return False
+        if status == 200:
+            self.errors.recovered("config")
+        else:
+            self.errors.error("config", "Failed to set config: %s", status)
+        return status == 200
 
     async def set_mode(self, mode: str) -> bool:
         """Set operation mode."""
         try:
-            session = await self._get_session()
-            data = {"mode": mode}
-            async with session.post(
-                f"{self.base_url}/api/mode",
-                data=json.dumps(data)
-            ) as response:
-                return response.status == 200
+            status, _ = await self._request("POST", "/api/mode", {"mode": mode})
         except Exception as ex:
-            _LOGGER.error("Error setting mode: %s", ex)
+            self.errors.error("mode", "Error setting mode: %s", ex)
             return False
+        if status == 200:
+            self.errors.recovered("mode")
+        else:
+            self.errors.error("mode", "Failed to set mode: %s", status)
+        return status == 200
 
     async def set_profile(self, profile: str) -> bool:
         """Set device profile."""
         try:
-            session = await self._get_session()
-            data = {"profile": profile}
-            async with session.post(
-                f"{self.base_url}/api/profile",
-                data=json.dumps(data)
-            ) as response:
-                return response.status == 200
+            status, _ = await self._request("POST", "/api/profile", {"profile": profile})
         except Exception as ex:
-            _LOGGER.error("Error setting profile: %s", ex)
+            self.errors.error("profile", "Error setting profile: %s", ex)
             return False
+        if status == 200:
+            self.errors.recovered("profile")
+        else:
+            self.errors.error("profile", "Failed to set profile: %s", status)
+        return status == 200
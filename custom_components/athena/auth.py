@@ -0,0 +1,120 @@
+"""Session-token authentication for Athena devices."""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import math
+import time
+from typing import Any
+
+import aiohttp
+
+from .const import AUTH_DEFAULT_TOKEN_TTL, AUTH_REFRESH_MARGIN, AUTH_RETRY_INTERVAL
+from .limiter import AthenaRateLimiter
+
+_LOGGER = logging.getLogger(__name__)
+
+AUTH_MODE_TOKEN = "token"
+AUTH_MODE_COOKIE = "cookie"
+AUTH_MODE_BASIC = "basic"
+
+# Statuses meaning the firmware has no login endpoint at all
+LOGIN_UNSUPPORTED = (404, 405, 501)
+
+
+class AthenaAuth:
+    """Log in once and reuse the session token for every request.
+
+    The device is asked for a token at ``/api/login``. A token in the response
+    body is sent as a bearer header; a login that only sets a cookie relies on
+    the session's cookie jar. Tokens are renewed shortly before they expire.
+    Firmware without a login endpoint, or a login that fails, falls back to
+    Basic auth.
+
+    Every successful or failed login bumps a generation counter. Callers hand
+    back the generation their credentials came from when they hit a 401, so
+    any number of concurrent failures trigger a single re-login.
+    """
+
+    def __init__(self, username: str, password: str, limiter: AthenaRateLimiter) -> None:
+        """Initialize the authenticator."""
+        self.username = username
+        self.password = password
+        self.limiter = limiter
+        self._basic = aiohttp.BasicAuth(username, password)
+        self._lock = asyncio.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget all cached credentials, e.g. when the session is recreated."""
+        self.mode: str | None = None
+        self._token: str | None = None
+        self._refresh_at = 0.0
+        self._generation = 0
+
+    async def async_credentials(
+        self, session: aiohttp.ClientSession, base_url: str
+    ) -> tuple[dict[str, str], aiohttp.BasicAuth | None, int]:
+        """Return the headers, Basic auth and generation for a request."""
+        if time.monotonic() >= self._refresh_at:
+            await self._async_login(session, base_url, self._generation)
+
+        if self.mode == AUTH_MODE_TOKEN:
+            return {"Authorization": f"Bearer {self._token}"}, None, self._generation
+        if self.mode == AUTH_MODE_COOKIE:
+            return {}, None, self._generation
+        return {}, self._basic, self._generation
+
+    async def async_reauthenticate(
+        self, session: aiohttp.ClientSession, base_url: str, generation: int
+    ) -> None:
+        """Log in again after credentials from ``generation`` were rejected."""
+        await self._async_login(session, base_url, generation)
+
+    async def _async_login(
+        self, session: aiohttp.ClientSession, base_url: str, generation: int
+    ) -> None:
+        """Obtain fresh credentials unless another caller already did."""
+        async with self._lock:
+            if generation != self._generation:
+                return
+            try:
+                await self._async_do_login(session, base_url)
+            finally:
+                self._generation += 1
+
+    async def _async_do_login(self, session: aiohttp.ClientSession, base_url: str) -> None:
+        """Perform the login request and update the cached credentials."""
+        payload = {"username": self.username, "password": self.password}
+        await self.limiter.acquire()
+        async with session.post(
+            f"{base_url}/api/login", data=json.dumps(payload)
+        ) as response:
+            if response.status in LOGIN_UNSUPPORTED:
+                _LOGGER.debug("%s has no token login, using Basic auth", base_url)
+                self.mode = AUTH_MODE_BASIC
+                self._token = None
+                self._refresh_at = math.inf
+                return
+            if response.status != 200:
+                _LOGGER.debug(
+                    "Token login to %s failed (%s), using Basic auth", base_url, response.status
+                )
+                self.mode = AUTH_MODE_BASIC
+                self._token = None
+                self._refresh_at = time.monotonic() + AUTH_RETRY_INTERVAL
+                return
+            try:
+                body: dict[str, Any] = await response.json(content_type=None) or {}
+            except ValueError:
+                body = {}
+
+        self._token = body.get("token")
+        self.mode = AUTH_MODE_TOKEN if self._token else AUTH_MODE_COOKIE
+        ttl = body.get("expires_in", AUTH_DEFAULT_TOKEN_TTL)
+        if isinstance(ttl, bool) or not isinstance(ttl, (int, float)) or ttl <= 0:
+            _LOGGER.debug("Ignoring invalid token lifetime %r from %s", ttl, base_url)
+            ttl = AUTH_DEFAULT_TOKEN_TTL
+        # Short-lived tokens renew halfway through instead of on every request
+        self._refresh_at = time.monotonic() + ttl - min(AUTH_REFRESH_MARGIN, ttl / 2)
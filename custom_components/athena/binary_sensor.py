@@ -6,7 +6,7 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -47,6 +47,17 @@ class AthenaBinarySensorEntity(CoordinatorEntity, BinarySensorEntity):
             "sw_version": coordinator.data.get("device_info", {}).get("firmware_version", "Unknown"),
         }
 
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        return super().available and self.coordinator.device_available
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        with self.coordinator.phase("write_binary_sensor"):
+            super()._handle_coordinator_update()
+
 
 class AthenaOnlineBinarySensor(AthenaBinarySensorEntity):
     """Online status binary sensor for Athena device."""
@@ -57,10 +68,15 @@ class AthenaOnlineBinarySensor(AthenaBinarySensorEntity):
         self._attr_name = "Athena Online"
         self._attr_device_class = BinarySensorDeviceClass.CONNECTIVITY
 
+    @property
+    def available(self) -> bool:
+        """Stay available so an outage is reported as offline."""
+        return True
+
     @property
     def is_on(self) -> bool | None:
         """Return true if the binary sensor is on."""
-        return self.coordinator.data.get("online")
+        return self.coordinator.device_available and self.coordinator.data.get("online", True)
 
 
 class AthenaFaultBinarySensor(AthenaBinarySensorEntity):
@@ -0,0 +1,140 @@
+"""Traffic capture and replay for Athena devices."""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from collections import defaultdict, deque
+from typing import TYPE_CHECKING, Any, Collection, Dict, List, Optional, Set, Tuple
+
+import aiohttp
+
+from .api import AthenaAPIClient, select_keys
+
+if TYPE_CHECKING:
+    from .coordinator import AthenaDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+FLUSH_EVERY = 20
+POLL_PATH = "/api/sensors"
+
+
+class AthenaTrafficRecorder:
+    """Append every request/response exchange to a JSON Lines file.
+
+    Each line is one exchange with short keys to keep captures small:
+    ``t`` seconds since capture start, ``m`` method, ``p`` path, ``s`` status,
+    ``d`` duration in seconds, ``b`` decoded body and ``e`` the exception type
+    for failed requests. Lines are buffered and written from the executor so
+    recording never does file I/O on the event loop. Flushes run one at a
+    time, so lines reach the file in the order they were recorded.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize the recorder."""
+        self.path = path
+        self._start = time.monotonic()
+        self._buffer: List[str] = []
+        self._lock = asyncio.Lock()
+        # Keep pending flushes referenced until they finish
+        self._tasks: Set[asyncio.Task[None]] = set()
+
+    def record(
+        self,
+        method: str,
+        path: str,
+        started: float,
+        status: Optional[int] = None,
+        body: Any = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        """Record one exchange that began at monotonic time ``started``."""
+        entry: Dict[str, Any] = {
+            "t": round(started - self._start, 4),
+            "m": method,
+            "p": path,
+            "d": round(time.monotonic() - started, 4),
+        }
+        if error is not None:
+            entry["e"] = type(error).__name__
+        else:
+            entry["s"] = status
+            if body is not None:
+                entry["b"] = body
+        self._buffer.append(json.dumps(entry, separators=(",", ":"), default=str))
+        if len(self._buffer) >= FLUSH_EVERY:
+            task = asyncio.get_running_loop().create_task(self.async_flush())
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def async_flush(self) -> None:
+        """Write buffered exchanges to disk."""
+        async with self._lock:
+            if not self._buffer:
+                return
+            lines, self._buffer = self._buffer, []
+            await asyncio.get_running_loop().run_in_executor(None, self._write, lines)
+
+    def _write(self, lines: List[str]) -> None:
+        """Append lines to the capture file."""
+        with open(self.path, "a", encoding="utf-8") as file:
+            file.write("\n".join(lines) + "\n")
+
+
+def load_capture(path: str) -> List[Dict[str, Any]]:
+    """Load a capture file. Blocking, run it in the executor."""
+    with open(path, "r", encoding="utf-8") as file:
+        return [json.loads(line) for line in file if line.strip()]
+
+
+class AthenaReplayClient(AthenaAPIClient):
+    """API client that answers from a capture instead of a device.
+
+    Responses for each method and path are served in recorded order, cycling
+    when exhausted, after sleeping the recorded latency divided by ``speed``.
+    Recorded failures are raised again, so field timeouts are reproduced too.
+    """
+
+    def __init__(self, exchanges: List[Dict[str, Any]], speed: float = 1.0) -> None:
+        """Initialize the replay client."""
+        super().__init__("replay", 0, "", "")
+        self.speed = speed
+        self._exchanges = exchanges
+        self._queues: Dict[Tuple[str, str], deque[Dict[str, Any]]] = defaultdict(deque)
+        for exchange in exchanges:
+            self._queues[(exchange["m"], exchange["p"])].append(exchange)
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        payload: Optional[Dict[str, Any]],
+        decode: bool,
+        keys: Optional[Collection[str]],
+        authenticate: bool,
+        timeout: Optional[float],
+    ) -> Tuple[int, Any]:
+        """Serve the next recorded exchange for this request."""
+        queue = self._queues.get((method, path))
+        if not queue:
+            raise aiohttp.ClientError(f"No recorded exchange for {method} {path}")
+        exchange = queue[0]
+        queue.rotate(-1)
+        
+        await asyncio.sleep(exchange["d"] / self.speed)
+        if (error := exchange.get("e")) is not None:
+            if error == "TimeoutError":
+                raise asyncio.TimeoutError
+            raise aiohttp.ClientError(f"Recorded {error}")
+        return exchange["s"], select_keys(exchange.get("b"), keys) if decode else None
+
+    async def async_drive(self, coordinator: AthenaDataUpdateCoordinator) -> None:
+        """Refresh the coordinator at the recorded poll cadence, scaled by speed."""
+        polls = [e["t"] for e in self._exchanges if e["m"] == "GET" and e["p"] == POLL_PATH]
+        previous = polls[0] if polls else 0.0
+        for started in polls:
+            await asyncio.sleep((started - previous) / self.speed)
+            previous = started
+            await coordinator.async_refresh()
@@ -8,17 +8,29 @@ import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_PORT, CONF_USERNAME
-from homeassistant.core import HomeAssistant
-from homeassistant.data_entry_flow import FlowResult
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.data_entry_flow import AbortFlow, FlowResult
 from homeassistant.exceptions import HomeAssistantError
 
+from .api import AthenaAPIClient
 from .const import (
+    ATTR_SERIAL_NUMBER,
+    CONF_ALIGN_POLLING,
+    CONF_CAPTURE_TRAFFIC,
     CONF_DEVICE_TYPE,
+    CONF_PROFILE_REFRESHES,
+    CONF_PROFILING,
+    CONF_RATE_BURST,
+    CONF_RATE_LIMIT,
     CONF_SCAN_INTERVAL,
     DEFAULT_PORT,
+    DEFAULT_RATE_BURST,
+    DEFAULT_RATE_LIMIT,
     DEFAULT_SCAN_INTERVAL,
     DEVICE_TYPES,
     DOMAIN,
+    PENDING_CLIENTS,
+    VALIDATION_TIMEOUT,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -40,9 +52,6 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
     
     Data has the keys from STEP_USER_DATA_SCHEMA with values provided by the user.
     """
-    # TODO: Implement actual connection validation
-    # For now, we'll do basic validation
-    
     if not data[CONF_HOST]:
         raise InvalidHost
     
@@ -52,8 +61,29 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
     if not data[CONF_USERNAME] or not data[CONF_PASSWORD]:
         raise InvalidAuth
     
-    # Return info that you want to store in the config entry.
-    return {"title": f"Athena {data[CONF_DEVICE_TYPE].title()} ({data[CONF_HOST]})"}
+    client = AthenaAPIClient(
+        data[CONF_HOST],
+        data[CONF_PORT],
+        data[CONF_USERNAME],
+        data[CONF_PASSWORD],
+        timeout=VALIDATION_TIMEOUT,
+    )
+    status = await client.connection_status()
+    if status != 200:
+        await client.close()
+        if status in (401, 403):
+            raise InvalidAuth
+        raise CannotConnect
+    device_info = await client.get_device_info()
+    
+    # Return info that you want to store in the config entry. The connected
+    # client and device info are handed to async_setup_entry.
+    return {
+        "title": f"Athena {data[CONF_DEVICE_TYPE].title()} ({data[CONF_HOST]})",
+        "serial_number": device_info.get(ATTR_SERIAL_NUMBER),
+        "client": client,
+        "device_info": device_info,
+    }
 
 
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -61,6 +91,14 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> OptionsFlowHandler:
+        """Get the options flow for this handler."""
+        return OptionsFlowHandler(config_entry)
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -68,6 +106,11 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors: dict[str, str] = {}
         
         if user_input is not None:
+            # Entries from before serial numbers were used as unique ID are
+            # only recognisable by their address
+            self._async_abort_entries_match(
+                {CONF_HOST: user_input[CONF_HOST], CONF_PORT: user_input[CONF_PORT]}
+            )
             try:
                 info = await validate_input(self.hass, user_input)
             except CannotConnect:
@@ -82,11 +125,21 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 _LOGGER.exception("Unexpected exception")
                 errors["base"] = "unknown"
             else:
-                # Create unique ID based on host and device type
-                unique_id = f"{user_input[CONF_HOST]}_{user_input[CONF_DEVICE_TYPE]}"
+                # Prefer the serial number, fall back to host and device type
+                unique_id = info["serial_number"] or (
+                    f"{user_input[CONF_HOST]}_{user_input[CONF_DEVICE_TYPE]}"
+                )
                 await self.async_set_unique_id(unique_id)
-                self._abort_if_unique_id_configured()
+                try:
+                    self._abort_if_unique_id_configured()
+                except AbortFlow:
+                    await info["client"].close()
+                    raise
                 
+                self.hass.data.setdefault(PENDING_CLIENTS, {})[unique_id] = (
+                    info["client"],
+                    info["device_info"],
+                )
                 return self.async_create_entry(title=info["title"], data=user_input)
 
         return self.async_show_form(
@@ -94,6 +147,54 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         )
 
 
+class OptionsFlowHandler(config_entries.OptionsFlow):
+    """Handle Athena options."""
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize options flow."""
+        self._entry = config_entry
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        options = self._entry.options
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_RATE_LIMIT,
+                        default=options.get(CONF_RATE_LIMIT, DEFAULT_RATE_LIMIT),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0.1, max=50)),
+                    vol.Optional(
+                        CONF_RATE_BURST,
+                        default=options.get(CONF_RATE_BURST, DEFAULT_RATE_BURST),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=100)),
+                    vol.Optional(
+                        CONF_ALIGN_POLLING,
+                        default=options.get(CONF_ALIGN_POLLING, False),
+                    ): bool,
+                    vol.Optional(
+                        CONF_CAPTURE_TRAFFIC,
+                        default=options.get(CONF_CAPTURE_TRAFFIC, False),
+                    ): bool,
+                    vol.Optional(
+                        CONF_PROFILING,
+                        default=options.get(CONF_PROFILING, False),
+                    ): bool,
+                    vol.Optional(
+                        CONF_PROFILE_REFRESHES,
+                        default=options.get(CONF_PROFILE_REFRESHES, 0),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=1000)),
+                }
+            ),
+        )
+
+
 class CannotConnect(HomeAssistantError):
     """Error to indicate we cannot connect."""
 
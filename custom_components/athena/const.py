@@ -11,6 +11,14 @@ CONF_PASSWORD = "password"
 CONF_DEVICE_TYPE = "device_type"
 CONF_SCAN_INTERVAL = "scan_interval"
 
+# Options
+CONF_CAPTURE_TRAFFIC = "capture_traffic"
+CONF_RATE_LIMIT = "rate_limit"
+CONF_RATE_BURST = "rate_burst"
+CONF_PROFILING = "profiling"
+CONF_PROFILE_REFRESHES = "profile_refreshes"
+CONF_ALIGN_POLLING = "align_polling"
+
 # Device Types
 DEVICE_TYPE_CONTROLLER = "controller"
 DEVICE_TYPE_MONITOR = "monitor"
@@ -26,6 +34,55 @@ DEVICE_TYPES = [
 DEFAULT_PORT = 80
 DEFAULT_SCAN_INTERVAL = 30
 DEFAULT_TIMEOUT = 10
+VALIDATION_TIMEOUT = 5
+DEFAULT_RATE_LIMIT = 2.0
+DEFAULT_RATE_BURST = 5
+DEFAULT_HEARTBEAT_INTERVAL = 5
+DEFAULT_HEARTBEAT_TIMEOUT = 2
+AUTH_DEFAULT_TOKEN_TTL = 3600
+AUTH_REFRESH_MARGIN = 60
+AUTH_RETRY_INTERVAL = 300
+
+ERROR_SUMMARY_INTERVAL = 300
+
+RECONCILE_MIN_RETRY = 10
+RECONCILE_MAX_RETRY = 300
+
+FLEET_CONCURRENCY = 16
+FLEET_DEVICE_TIMEOUT = 10
+
+CAPTURE_FILE = "athena_capture_{entry_id}.jsonl"
+PROFILE_FILE = "athena_profile_{entry_id}.prof"
+
+DEFAULT_WS_THROTTLE = 1.0
+
+PRESSURE_TREND_WINDOW = 3 * 3600
+PRESSURE_TREND_MIN_SPAN = 15 * 60
+
+# Poll this long after the device's next expected sample
+ALIGN_MARGIN = 1.0
+ALIGN_MIN_DELAY = 2.0
+
+# hass.data key for clients validated by the config flow, by unique ID
+PENDING_CLIENTS = f"{DOMAIN}_pending_clients"
+
+# hass.data key for coordinators kept alive across a reload, by entry ID
+PARKED_COORDINATORS = f"{DOMAIN}_parked_coordinators"
+# Close a parked coordinator's client if its entry isn't set up again by then
+PARK_TIMEOUT = 60
+
+# Storage
+STORAGE_VERSION = 1
+
+# Payload encodings negotiated with the device
+CONTENT_TYPE_JSON = "application/json"
+CONTENT_TYPE_MSGPACK = "application/msgpack"
+CONTENT_TYPE_CBOR = "application/cbor"
+CONTENT_TYPES_MSGPACK = (CONTENT_TYPE_MSGPACK, "application/x-msgpack")
+
+# Responses larger than this are parsed off the event loop
+STREAM_PARSE_THRESHOLD = 256 * 1024
+STREAM_CHUNK_SIZE = 64 * 1024
 
 # Entity Names
 SENSOR_TEMPERATURE = "temperature"
@@ -33,6 +90,18 @@ SENSOR_HUMIDITY = "humidity"
 SENSOR_PRESSURE = "pressure"
 SENSOR_STATUS = "status"
 SENSOR_SIGNAL_STRENGTH = "signal_strength"
+SENSOR_DEW_POINT = "dew_point"
+SENSOR_ABSOLUTE_HUMIDITY = "absolute_humidity"
+SENSOR_HEAT_INDEX = "heat_index"
+SENSOR_PRESSURE_TREND = "pressure_trend"
+
+# Payload keys identifying a device sample
+SAMPLE_SEQUENCE = "seq"
+SAMPLE_TIMESTAMP = "timestamp"
+SAMPLE_KEYS = {SAMPLE_SEQUENCE, SAMPLE_TIMESTAMP}
+
+# Payload keys derived metrics are computed from
+DERIVED_INPUT_KEYS = {SENSOR_TEMPERATURE, SENSOR_HUMIDITY, SENSOR_PRESSURE, "channels"}
 
 SWITCH_POWER = "power"
 SWITCH_AUTO_MODE = "auto_mode"
@@ -42,6 +111,27 @@ BINARY_SENSOR_ONLINE = "online"
 BINARY_SENSOR_FAULT = "fault"
 BINARY_SENSOR_MAINTENANCE = "maintenance"
 
+NUMBER_THRESHOLD = "threshold"
+NUMBER_INTERVAL = "interval"
+
+SELECT_MODE = "mode"
+SELECT_PROFILE = "profile"
+
+MODE_OPTIONS = ["manual", "automatic", "scheduled", "maintenance"]
+PROFILE_OPTIONS = ["eco", "normal", "performance", "custom"]
+
+# Services
+SERVICE_APPLY_PROFILE = "apply_profile"
+SERVICE_SET_CONFIG = "set_config"
+SERVICE_SET_POWER = "set_power"
+SERVICE_MEMORY_REPORT = "memory_report"
+
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_CONFIG = "config"
+ATTR_PROFILE = "profile"
+ATTR_STATE = "state"
+ATTR_DURATION = "duration"
+
 # Attributes
 ATTR_DEVICE_INFO = "device_info"
 ATTR_FIRMWARE_VERSION = "firmware_version"
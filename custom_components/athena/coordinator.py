@@ -3,69 +3,350 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from datetime import timedelta
+import time
+import weakref
+from collections.abc import Callable
+from contextlib import AbstractContextManager
+from datetime import datetime, timedelta
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_PORT, CONF_USERNAME
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import CONF_SCAN_INTERVAL, DOMAIN
+from .api import AthenaAPIClient
+from .capture import AthenaTrafficRecorder
+from .const import (
+    ALIGN_MARGIN,
+    ALIGN_MIN_DELAY,
+    CAPTURE_FILE,
+    CONF_ALIGN_POLLING,
+    CONF_CAPTURE_TRAFFIC,
+    CONF_PROFILE_REFRESHES,
+    CONF_PROFILING,
+    CONF_RATE_BURST,
+    CONF_RATE_LIMIT,
+    CONF_SCAN_INTERVAL,
+    DEFAULT_HEARTBEAT_INTERVAL,
+    DEFAULT_HEARTBEAT_TIMEOUT,
+    DEFAULT_RATE_BURST,
+    DEFAULT_RATE_LIMIT,
+    DERIVED_INPUT_KEYS,
+    DOMAIN,
+    NUMBER_INTERVAL,
+    PROFILE_FILE,
+    SAMPLE_KEYS,
+    SAMPLE_SEQUENCE,
+    SAMPLE_TIMESTAMP,
+)
+from .derived import AthenaDerivedMetrics
+from .profiler import NULL_PHASE, AthenaRefreshProfiler
+from .reconcile import AthenaReconciler
 
 _LOGGER = logging.getLogger(__name__)
 
+_COORDINATORS: weakref.WeakSet[AthenaDataUpdateCoordinator] = weakref.WeakSet()
+
+
+def live_coordinators() -> list[AthenaDataUpdateCoordinator]:
+    """Return all coordinators that are still alive."""
+    return list(_COORDINATORS)
+
 
 class AthenaDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching data from the Athena device."""
 
-    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        api: AthenaAPIClient | None = None,
+        device_info: dict[str, Any] | None = None,
+    ) -> None:
         """Initialize."""
         self.entry = entry
         self.host = entry.data[CONF_HOST]
         self.port = entry.data[CONF_PORT]
         self.username = entry.data[CONF_USERNAME]
         self.password = entry.data[CONF_PASSWORD]
-        
-        scan_interval = entry.data.get(CONF_SCAN_INTERVAL, 30)
-        
+        self.api = api or AthenaAPIClient(
+            self.host, self.port, self.username, self.password
+        )
+        self.profiler: AthenaRefreshProfiler | None = None
+        if entry.options.get(CONF_PROFILING):
+            self.profiler = AthenaRefreshProfiler(
+                entry.options.get(CONF_PROFILE_REFRESHES, 0),
+                hass.config.path(PROFILE_FILE.format(entry_id=entry.entry_id)),
+            )
+        self._configure_api(hass, entry)
+        # Driven by the heartbeat probe, independently of the full poll
+        self.device_available = True
+        self._device_info: dict[str, Any] = device_info or {}
+        self.reconciler = AthenaReconciler(hass, self.api, entry.entry_id)
+        self._observers: list[Callable[[AthenaDataUpdateCoordinator], None]] = []
+        self.derived = AthenaDerivedMetrics()
+        self._align_polling = entry.options.get(CONF_ALIGN_POLLING, False)
+        self._sample_id: Any = None
+        self._sample_received: float | None = None
+        self._last_status: dict[str, Any] | None = None
+        self.duplicate_samples = 0
+        self._scan_interval = timedelta(seconds=entry.data.get(CONF_SCAN_INTERVAL, 30))
+
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=scan_interval),
+            update_interval=self._scan_interval,
+            # Returning the previous snapshot for a repeated sample must not
+            # wake every entity.
+            always_update=False,
         )
+        _COORDINATORS.add(self)
+
+    def _configure_api(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+        """Apply the entry options to the client, which may be reused."""
+        api = self.api
+        api.limiter.rate = entry.options.get(CONF_RATE_LIMIT, DEFAULT_RATE_LIMIT)
+        api.limiter.burst = entry.options.get(CONF_RATE_BURST, DEFAULT_RATE_BURST)
+        api.profiler = self.profiler
+        if not entry.options.get(CONF_CAPTURE_TRAFFIC):
+            if api.recorder is not None:
+                hass.async_create_task(api.recorder.async_flush())
+                api.recorder = None
+        elif api.recorder is None:
+            api.recorder = AthenaTrafficRecorder(
+                hass.config.path(CAPTURE_FILE.format(entry_id=entry.entry_id))
+            )
+
+    @property
+    def device_info(self) -> dict[str, Any]:
+        """Return the cached static device information."""
+        return self._device_info
+
+    def matches(self, entry: ConfigEntry) -> bool:
+        """Return True if this coordinator talks to the device ``entry`` describes."""
+        return (self.host, self.port, self.username, self.password) == (
+            entry.data[CONF_HOST],
+            entry.data[CONF_PORT],
+            entry.data[CONF_USERNAME],
+            entry.data[CONF_PASSWORD],
+        )
+
+    @callback
+    def async_adopt(self, previous: AthenaDataUpdateCoordinator) -> None:
+        """Continue where a coordinator from before a reload left off.
+
+        The snapshot, sample tracking, derived-metric history, observers and
+        the reconciler carry over, so entities attach with current values and
+        the next refresh happens on the normal schedule instead of immediately.
+        Keeping the reconciler means a desired-state save still pending from
+        just before the reload is neither lost nor raced by a second store.
+        """
+        self.data = previous.data
+        self.last_update_success = previous.last_update_success
+        self.device_available = previous.device_available
+        self.derived = previous.derived
+        self.reconciler = previous.reconciler
+        self._sample_id = previous._sample_id
+        self._sample_received = previous._sample_received
+        self._last_status = previous._last_status
+        self.duplicate_samples = previous.duplicate_samples
+        self.async_take_observers(previous)
+
+    @callback
+    def async_take_observers(self, previous: AthenaDataUpdateCoordinator) -> None:
+        """Keep calling the observers of a coordinator this one replaces.
+
+        The list itself is shared rather than copied, so removal callbacks
+        handed out by the previous coordinator keep working.
+        """
+        self._observers = previous._observers
+
+    def phase(self, name: str) -> AbstractContextManager[None]:
+        """Return a context manager timing phase ``name`` when profiling."""
+        if self.profiler is None:
+            return NULL_PHASE
+        return self.profiler.phase(name)
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from API endpoint."""
+        if self.profiler is None:
+            return await self._async_refresh_data()
+        self.profiler.refresh_started()
+        try:
+            return await self._async_refresh_data()
+        finally:
+            self.profiler.refresh_finished()
+
+    async def _async_refresh_data(self) -> dict[str, Any]:
+        """Fetch a snapshot and build the coordinator data from it."""
+        if not self.device_available:
+            # Don't spend a full request and timeout on a device the
+            # heartbeat already knows is gone.
+            raise UpdateFailed(f"Device {self.host} is not responding to heartbeat")
         try:
-            # TODO: Implement actual API communication
-            # This is a placeholder that simulates device data
-            return await self._fetch_device_data()
+            with self.phase("fetch"):
+                sensors, status = await self._fetch_device_data()
         except Exception as err:
             raise UpdateFailed(f"Error communicating with API: {err}") from err
 
-    async def _fetch_device_data(self) -> dict[str, Any]:
-        """Fetch data from the Athena device."""
-        # Placeholder implementation - replace with actual device communication
-        await asyncio.sleep(0.1)  # Simulate network delay
-        
-        return {
-            "status": "online",
-            "temperature": 23.5,
-            "humidity": 45.2,
-            "pressure": 1013.25,
-            "signal_strength": -67,
-            "power": True,
-            "auto_mode": True,
-            "alarm": False,
-            "online": True,
-            "fault": False,
-            "maintenance": False,
-            "device_info": {
-                "firmware_version": "1.2.3",
-                "hardware_version": "2.1",
-                "serial_number": "ATH123456789",
-                "model": "Athena Controller",
-            }
+        now = time.monotonic()
+        sample_id = sensors.get(SAMPLE_SEQUENCE, sensors.get(SAMPLE_TIMESTAMP))
+        if (
+            self.data is not None
+            and sample_id is not None
+            and sample_id == self._sample_id
+            and status == self._last_status
+        ):
+            # Same sample as last time: skip snapshot, derived metrics and
+            # listener fan-out entirely.
+            self.duplicate_samples += 1
+            self.reconciler.async_reconcile(self.data)
+            self._align_next_poll(self.data, now)
+            return self.data
+
+        if sample_id is None or sample_id != self._sample_id:
+            self._sample_id = sample_id
+            self._sample_received = now
+        self._last_status = status
+
+        with self.phase("snapshot"):
+            data = {**status, **sensors, "device_info": self._device_info}
+            self.reconciler.async_reconcile(data)
+        with self.phase("derived"):
+            self.derived.apply(data)
+        self._align_next_poll(data, now)
+        return data
+
+    @property
+    def sample_age(self) -> float | None:
+        """Return the seconds since the latest device sample was first seen.
+
+        Measured on the local monotonic clock; the device's own timestamp is
+        only used to tell samples apart, since its clock may drift from ours.
+        """
+        if self._sample_received is None:
+            return None
+        return time.monotonic() - self._sample_received
+
+    def _align_next_poll(self, data: dict[str, Any], now: float) -> None:
+        """Schedule the next poll just after the device's next expected sample.
+
+        Only active with the align_polling option and when the device reports
+        its sampling interval; otherwise the configured scan interval applies.
+        A sample that is late gets one quick retry; if it still hasn't arrived
+        the device is lagging or has stopped sampling, and polling falls back
+        to the scan interval until a new sample shows up.
+        """
+        interval = data.get(NUMBER_INTERVAL)
+        if (
+            not self._align_polling
+            or isinstance(interval, bool)
+            or not isinstance(interval, (int, float))
+            or interval <= 0
+            or self._sample_received is None
+        ):
+            self.update_interval = self._scan_interval
+            return
+
+        delay = interval - (now - self._sample_received) + ALIGN_MARGIN
+        if delay <= -ALIGN_MIN_DELAY:
+            # The quick retry already missed it
+            self.update_interval = self._scan_interval
+            return
+        self.update_interval = timedelta(
+            seconds=min(max(delay, ALIGN_MIN_DELAY), interval + ALIGN_MARGIN)
+        )
+
+    async def _fetch_device_data(self) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Fetch sensor data and status from the Athena device."""
+        sensors, status = await asyncio.gather(
+            self.api.get_sensor_data(self._wanted_sensor_keys()), self.api.get_status()
+        )
+        if not sensors and not status:
+            raise UpdateFailed(f"No data received from {self.host}")
+
+        # Device information is static, only fetch it once
+        if not self._device_info:
+            self._device_info = await self.api.get_device_info()
+
+        return sensors, status
+
+    @callback
+    def _wanted_sensor_keys(self) -> set[str] | None:
+        """Return the sensor payload keys enabled entities and the coordinator use.
+
+        Entity unique IDs end in the payload key they show. Before any entity
+        has been registered (first setup) everything is wanted.
+        """
+        prefix = f"{self.entry.entry_id}_"
+        keys = {
+            entity.unique_id.removeprefix(prefix)
+            for entity in er.async_entries_for_config_entry(
+                er.async_get(self.hass), self.entry.entry_id
+            )
+            if entity.disabled_by is None
         }
+        if not keys:
+            return None
+        return keys | self.reconciler.desired.keys() | DERIVED_INPUT_KEYS | SAMPLE_KEYS | {NUMBER_INTERVAL}
+
+    @callback
+    def async_add_observer(
+        self, update_callback: Callable[[AthenaDataUpdateCoordinator], None]
+    ) -> CALLBACK_TYPE:
+        """Call back with the coordinator on every update without keeping polling alive.
+
+        Unlike listeners, observers don't schedule refreshes, so something
+        watching the coordinator can't keep it running after its entry unloads.
+        Observers follow the entry across reloads, so they are passed the
+        coordinator that updated rather than holding on to this one.
+        """
+        observers = self._observers
+        observers.append(update_callback)
+
+        @callback
+        def remove_observer() -> None:
+            observers.remove(update_callback)
+
+        return remove_observer
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update all registered listeners and observers."""
+        with self.phase("listeners"):
+            super().async_update_listeners()
+            for update_callback in list(self._observers):
+                update_callback(self)
+
+    async def async_set_config(self, changes: dict[str, Any]) -> bool:
+        """Set desired configuration values and refresh."""
+        success = await self.reconciler.async_set(changes)
+        await self.async_request_refresh()
+        return success
+
+    @callback
+    def async_start_heartbeat(self) -> CALLBACK_TYPE:
+        """Start the liveness probe and return a callback that stops it."""
+        return async_track_time_interval(
+            self.hass,
+            self._async_heartbeat,
+            timedelta(seconds=DEFAULT_HEARTBEAT_INTERVAL),
+        )
+
+    async def _async_heartbeat(self, _now: datetime) -> None:
+        """Probe the device and flip availability for all its entities."""
+        alive = await self.api.probe(DEFAULT_HEARTBEAT_TIMEOUT)
+        if alive == self.device_available:
+            return
+
+        self.device_available = alive
+        if alive:
+            _LOGGER.info("Athena device %s is responding again", self.host)
+            await self.async_request_refresh()
+        else:
+            _LOGGER.warning("Athena device %s stopped responding", self.host)
+            self.async_update_listeners()
@@ -0,0 +1,166 @@
+"""Derived metrics computed once per refresh for Athena integration."""
+from __future__ import annotations
+
+import math
+import time
+from collections import deque
+from typing import Any
+
+from .const import (
+    PRESSURE_TREND_MIN_SPAN,
+    PRESSURE_TREND_WINDOW,
+    SENSOR_ABSOLUTE_HUMIDITY,
+    SENSOR_DEW_POINT,
+    SENSOR_HEAT_INDEX,
+    SENSOR_HUMIDITY,
+    SENSOR_PRESSURE,
+    SENSOR_PRESSURE_TREND,
+    SENSOR_TEMPERATURE,
+)
+
+ATTR_CHANNELS = "channels"
+
+# Magnus formula coefficients (Sonntag 1990), valid for -45 to 60 °C
+MAGNUS_A = 17.62
+MAGNUS_B = 243.12
+
+
+def channel_readings(data: dict[str, Any]) -> list[dict[str, Any]]:
+    """Return the per-channel readings of a snapshot, in device order."""
+    channels = data.get(ATTR_CHANNELS)
+    if not isinstance(channels, list):
+        return []
+    return [channel for channel in channels if isinstance(channel, dict)]
+
+
+def dew_points(
+    temperatures: list[float | None], humidities: list[float | None]
+) -> list[float | None]:
+    """Dew point in °C for each temperature/relative humidity pair."""
+    result: list[float | None] = []
+    for t, rh in zip(temperatures, humidities):
+        if t is None or not rh or rh <= 0:
+            result.append(None)
+            continue
+        gamma = math.log(rh / 100) + MAGNUS_A * t / (MAGNUS_B + t)
+        result.append(round(MAGNUS_B * gamma / (MAGNUS_A - gamma), 2))
+    return result
+
+
+def absolute_humidities(
+    temperatures: list[float | None], humidities: list[float | None]
+) -> list[float | None]:
+    """Absolute humidity in g/m³ for each temperature/relative humidity pair."""
+    return [
+        None
+        if t is None or rh is None
+        else round(
+            6.112 * math.exp(MAGNUS_A * t / (MAGNUS_B + t)) * rh * 2.1674 / (273.15 + t), 2
+        )
+        for t, rh in zip(temperatures, humidities)
+    ]
+
+
+def heat_indices(
+    temperatures: list[float | None], humidities: list[float | None]
+) -> list[float | None]:
+    """NWS heat index in °C for each temperature/relative humidity pair."""
+    result: list[float | None] = []
+    for t, rh in zip(temperatures, humidities):
+        if t is None or rh is None:
+            result.append(None)
+            continue
+        f = t * 9 / 5 + 32
+        # Steadman's simple formula, used below ~80 °F
+        hi = 0.5 * (f + 61.0 + (f - 68.0) * 1.2 + rh * 0.094)
+        if (hi + f) / 2 >= 80:
+            hi = (
+                -42.379
+                + 2.04901523 * f
+                + 10.14333127 * rh
+                - 0.22475541 * f * rh
+                - 6.83783e-3 * f * f
+                - 5.481717e-2 * rh * rh
+                + 1.22874e-3 * f * f * rh
+                + 8.5282e-4 * f * rh * rh
+                - 1.99e-6 * f * f * rh * rh
+            )
+            if rh < 13 and 80 <= f <= 112:
+                hi -= (13 - rh) / 4 * math.sqrt((17 - abs(f - 95)) / 17)
+            elif rh > 85 and 80 <= f <= 87:
+                hi += (rh - 85) / 10 * (87 - f) / 5
+        result.append(round((hi - 32) * 5 / 9, 2))
+    return result
+
+
+class AthenaDerivedMetrics:
+    """Compute dew point, absolute humidity, heat index and pressure trend.
+
+    Results are cached against their inputs, so a snapshot whose temperature,
+    humidity and pressure didn't change costs a tuple comparison. Multi-channel
+    devices reporting a ``channels`` list get every channel computed in one
+    pass and the results written back into each channel.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the metrics engine."""
+        self._inputs: tuple[Any, ...] | None = None
+        self._results: dict[str, Any] = {}
+        self._channel_results: list[dict[str, Any]] = []
+        self._pressures: deque[tuple[float, float]] = deque()
+        self._trend: float | None = None
+
+    def apply(self, data: dict[str, Any]) -> None:
+        """Add derived metrics to a snapshot in place."""
+        channels = channel_readings(data)
+        readings = [data, *channels]
+        temperatures = [r.get(SENSOR_TEMPERATURE) for r in readings]
+        humidities = [r.get(SENSOR_HUMIDITY) for r in readings]
+        pressure = data.get(SENSOR_PRESSURE)
+
+        if pressure is not None:
+            self._update_trend(pressure)
+
+        inputs = (tuple(temperatures), tuple(humidities))
+        if inputs != self._inputs:
+            self._inputs = inputs
+            per_reading = list(
+                zip(
+                    dew_points(temperatures, humidities),
+                    absolute_humidities(temperatures, humidities),
+                    heat_indices(temperatures, humidities),
+                )
+            )
+            results = [
+                {
+                    SENSOR_DEW_POINT: dew_point,
+                    SENSOR_ABSOLUTE_HUMIDITY: absolute,
+                    SENSOR_HEAT_INDEX: heat_index,
+                }
+                for dew_point, absolute, heat_index in per_reading
+            ]
+            self._results, self._channel_results = results[0], results[1:]
+
+        data.update(self._results)
+        data[SENSOR_PRESSURE_TREND] = self._trend
+        for channel, results in zip(channels, self._channel_results):
+            channel.update(results)
+
+    def _update_trend(self, pressure: float) -> None:
+        """Record a pressure sample and recompute the trend.
+
+        Both ends of the window move with every sample, so the trend is
+        recomputed each time; it is a single subtraction.
+        """
+        now = time.monotonic()
+        history = self._pressures
+        history.append((now, pressure))
+        while now - history[0][0] > PRESSURE_TREND_WINDOW:
+            history.popleft()
+
+        span = now - history[0][0]
+        if span < PRESSURE_TREND_MIN_SPAN:
+            self._trend = None
+            return
+        # Change over the window, scaled to hPa per 3 hours
+        self._trend = round((pressure - history[0][1]) * PRESSURE_TREND_WINDOW / span, 2)
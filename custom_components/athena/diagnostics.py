@@ -0,0 +1,36 @@
+"""Diagnostics support for Athena integration."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+
+from .const import ATTR_SERIAL_NUMBER, DOMAIN
+from .coordinator import AthenaDataUpdateCoordinator
+
+TO_REDACT = {CONF_PASSWORD, CONF_USERNAME, ATTR_SERIAL_NUMBER}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: AthenaDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    return {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+        "data": async_redact_data(coordinator.data or {}, TO_REDACT),
+        "last_update_success": coordinator.last_update_success,
+        "device_available": coordinator.device_available,
+        "update_interval": coordinator.update_interval.total_seconds()
+        if coordinator.update_interval
+        else None,
+        "sample_age": coordinator.sample_age,
+        "duplicate_samples": coordinator.duplicate_samples,
+        "rate_limiter": coordinator.api.limiter.as_dict(),
+        "errors": coordinator.api.errors.as_dict(),
+        "profiling": coordinator.profiler.as_dict() if coordinator.profiler else None,
+    }
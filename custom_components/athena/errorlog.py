@@ -0,0 +1,91 @@
+"""Rate-limited error logging for Athena integration."""
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+from .const import ERROR_SUMMARY_INTERVAL
+
+
+@dataclass
+class _Failure:
+    """An endpoint that is currently failing."""
+
+    since: float
+    last_report: float
+    pending: int = 0
+    message: str = ""
+    args: tuple[Any, ...] = field(default_factory=tuple)
+
+
+class AthenaErrorLog:
+    """Log the first failure per endpoint and summarise the repeats.
+
+    While an endpoint keeps failing, further errors are only counted; every
+    ``summary_interval`` seconds one line reports how many were suppressed,
+    together with the latest error. The first success afterwards logs a single
+    recovery message. During a site-wide outage this turns thousands of lines
+    a minute into a handful per device.
+    """
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        host: str,
+        summary_interval: float = ERROR_SUMMARY_INTERVAL,
+    ) -> None:
+        """Initialize the error log."""
+        self._logger = logger
+        self.host = host
+        self.summary_interval = summary_interval
+        self._failing: dict[str, _Failure] = {}
+        self.suppressed: dict[str, int] = {}
+
+    def error(self, endpoint: str, message: str, *args: Any) -> None:
+        """Report a failure of ``endpoint``."""
+        now = time.monotonic()
+        if (failure := self._failing.get(endpoint)) is None:
+            self._failing[endpoint] = _Failure(since=now, last_report=now)
+            self._logger.error("%s: " + message, self.host, *args)
+            return
+        
+        failure.pending += 1
+        failure.message = message
+        failure.args = args
+        self.suppressed[endpoint] = self.suppressed.get(endpoint, 0) + 1
+        if now - failure.last_report >= self.summary_interval:
+            self._logger.error(
+                "%s: %s still failing, %d repeated errors in the last %.0f s, latest: "
+                + message,
+                self.host,
+                endpoint,
+                failure.pending,
+                now - failure.last_report,
+                *args,
+            )
+            failure.pending = 0
+            failure.last_report = now
+
+    def recovered(self, endpoint: str) -> None:
+        """Report a success of ``endpoint``, logging once if it was failing."""
+        if not self._failing or (failure := self._failing.pop(endpoint, None)) is None:
+            return
+        self._logger.info(
+            "%s: %s recovered after %.0f s",
+            self.host,
+            endpoint,
+            time.monotonic() - failure.since,
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the failing endpoints and suppressed counts."""
+        now = time.monotonic()
+        return {
+            "failing": {
+                endpoint: round(now - failure.since, 1)
+                for endpoint, failure in self._failing.items()
+            },
+            "suppressed": dict(self.suppressed),
+        }
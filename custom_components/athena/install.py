@@ -20,6 +20,19 @@ REQUIRED_FILES = [
     "binary_sensor.py",
     "number.py",
     "select.py",
+    "api.py",
+    "auth.py",
+    "capture.py",
+    "derived.py",
+    "diagnostics.py",
+    "errorlog.py",
+    "limiter.py",
+    "memory.py",
+    "profiler.py",
+    "reconcile.py",
+    "services.py",
+    "services.yaml",
+    "websocket.py",
 ]
 
 
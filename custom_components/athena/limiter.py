@@ -0,0 +1,65 @@
+"""Per-device request rate limiting for Athena integration."""
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+
+
+class AthenaRateLimiter:
+    """Token bucket shared by every request to one device.
+
+    The bucket holds up to ``burst`` tokens and refills at ``rate`` tokens per
+    second. A request that finds the bucket empty waits its turn instead of
+    failing; waiters are served in arrival order. Time spent waiting is
+    accumulated so it can be reported in diagnostics.
+    """
+
+    def __init__(self, rate: float, burst: int) -> None:
+        """Initialize the limiter."""
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+        self.requests = 0
+        self.delayed = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def _refill(self) -> None:
+        """Add the tokens earned since the last refill."""
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> float:
+        """Take one token, waiting for it if needed. Returns the time waited."""
+        started = time.monotonic()
+        # asyncio.Lock wakes waiters in FIFO order, which makes this the queue
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+        
+        waited = time.monotonic() - started
+        self.requests += 1
+        if waited > 0.001:
+            self.delayed += 1
+            self.total_wait += waited
+            self.max_wait = max(self.max_wait, waited)
+        return waited
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the configuration and wait statistics."""
+        return {
+            "rate": self.rate,
+            "burst": self.burst,
+            "requests": self.requests,
+            "delayed": self.delayed,
+            "total_wait": round(self.total_wait, 3),
+            "max_wait": round(self.max_wait, 3),
+            "average_wait": round(self.total_wait / self.requests, 4) if self.requests else 0.0,
+        }
@@ -0,0 +1,132 @@
+"""Memory profiling for Athena integration."""
+from __future__ import annotations
+
+import asyncio
+import gc
+import sys
+import tracemalloc
+from pathlib import Path
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from .api import live_clients
+from .const import DOMAIN, PARKED_COORDINATORS
+from .coordinator import AthenaDataUpdateCoordinator, live_coordinators
+
+PACKAGE_DIR = str(Path(__file__).parent)
+TRACEBACK_FRAMES = 25
+TOP_MODULES = 20
+
+# Reports share the process-wide tracemalloc state, so they run one at a time
+_REPORT_LOCK = asyncio.Lock()
+
+
+def deep_sizeof(obj: Any) -> int:
+    """Approximate the memory held by a JSON-like structure."""
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_sizeof(k) + deep_sizeof(v) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set)):
+        size += sum(deep_sizeof(item) for item in obj)
+    return size
+
+
+def _attribute_allocations(snapshot: tracemalloc.Snapshot) -> dict[str, dict[str, int]]:
+    """Group live traced allocations by the integration module that caused them.
+
+    Each allocation is charged to the innermost frame inside this package, so
+    memory allocated by aiohttp or Home Assistant on our behalf counts against
+    the module that called into them.
+    """
+    modules: dict[str, dict[str, int]] = {}
+    for stat in snapshot.statistics("traceback"):
+        for frame in stat.traceback:
+            if frame.filename.startswith(PACKAGE_DIR):
+                module = Path(frame.filename).stem
+                usage = modules.setdefault(module, {"size": 0, "count": 0})
+                usage["size"] += stat.size
+                usage["count"] += stat.count
+                break
+    return dict(
+        sorted(modules.items(), key=lambda item: item[1]["size"], reverse=True)[:TOP_MODULES]
+    )
+
+
+def _collect_trace(stop_tracing: bool) -> tuple[int, int, dict[str, dict[str, int]]]:
+    """Snapshot the trace and attribute it, for running in the executor.
+
+    Returns the traced current and peak size and the per-module usage. Taking
+    and filtering the snapshot and the garbage collection afterwards all walk
+    every traced block, so none of it belongs on the event loop.
+    """
+    try:
+        snapshot = tracemalloc.take_snapshot()
+        traced_current, traced_peak = tracemalloc.get_traced_memory()
+    finally:
+        if stop_tracing:
+            tracemalloc.stop()
+    snapshot = snapshot.filter_traces(
+        [tracemalloc.Filter(True, f"{PACKAGE_DIR}/*", all_frames=True)]
+    )
+    modules = _attribute_allocations(snapshot)
+    # Drop unreachable objects so the live counts reflect real leaks
+    gc.collect()
+    return traced_current, traced_peak, modules
+
+
+async def async_memory_report(hass: HomeAssistant, duration: float) -> dict[str, Any]:
+    """Trace allocations for ``duration`` seconds and report per-entry usage.
+
+    tracemalloc is only enabled for the length of the report (unless something
+    else already enabled it), so production pays nothing between reports.
+    Overlapping calls wait for the running report instead of stopping its
+    trace underneath it.
+    """
+    async with _REPORT_LOCK:
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start(TRACEBACK_FRAMES)
+        try:
+            await asyncio.sleep(duration)
+        except BaseException:
+            if started_tracing:
+                tracemalloc.stop()
+            raise
+        traced_current, traced_peak, modules = await hass.async_add_executor_job(
+            _collect_trace, started_tracing
+        )
+
+    loaded: dict[str, AthenaDataUpdateCoordinator] = hass.data.get(DOMAIN, {})
+    # Coordinators parked across a reload are kept on purpose, not leaked
+    owned = [
+        *loaded.values(),
+        *(coordinator for coordinator, _ in hass.data.get(PARKED_COORDINATORS, {}).values()),
+    ]
+    owned_ids = {id(coordinator) for coordinator in owned}
+    owned_clients = {id(coordinator.api) for coordinator in owned}
+    clients = live_clients()
+    coordinators = live_coordinators()
+
+    return {
+        "traced_seconds": duration,
+        "traced_current": traced_current,
+        "traced_peak": traced_peak,
+        "modules": modules,
+        "live_clients": len(clients),
+        "open_sessions": sum(1 for client in clients if client.session_open),
+        "orphaned_clients": sum(1 for client in clients if id(client) not in owned_clients),
+        "live_coordinators": len(coordinators),
+        "orphaned_coordinators": sum(
+            1 for coordinator in coordinators if id(coordinator) not in owned_ids
+        ),
+        "entries": {
+            entry_id: {
+                "title": coordinator.entry.title,
+                "snapshot_size": deep_sizeof(coordinator.data),
+                "session_open": coordinator.api.session_open,
+                "listeners": len(coordinator._listeners),  # pylint: disable=protected-access
+            }
+            for entry_id, coordinator in loaded.items()
+        },
+    }
@@ -3,11 +3,11 @@ from __future__ import annotations
 
 from homeassistant.components.number import NumberEntity, NumberMode
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import DOMAIN, NUMBER_INTERVAL, NUMBER_THRESHOLD
 from .coordinator import AthenaDataUpdateCoordinator
 
 
@@ -43,13 +43,24 @@ class AthenaNumberEntity(CoordinatorEntity, NumberEntity):
             "sw_version": coordinator.data.get("device_info", {}).get("firmware_version", "Unknown"),
         }
 
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        return super().available and self.coordinator.device_available
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        with self.coordinator.phase("write_number"):
+            super()._handle_coordinator_update()
+
 
 class AthenaThresholdNumber(AthenaNumberEntity):
     """Threshold number entity for Athena device."""
 
     def __init__(self, coordinator: AthenaDataUpdateCoordinator) -> None:
         """Initialize the threshold number."""
-        super().__init__(coordinator, "threshold")
+        super().__init__(coordinator, NUMBER_THRESHOLD)
         self._attr_name = "Athena Threshold"
         self._attr_native_min_value = 0
         self._attr_native_max_value = 100
@@ -60,12 +71,11 @@ class AthenaThresholdNumber(AthenaNumberEntity):
     @property
     def native_value(self) -> float | None:
         """Return the entity value to represent the entity state."""
-        return self.coordinator.data.get("threshold", 50)
+        return self.coordinator.data.get(NUMBER_THRESHOLD, 50)
 
     async def async_set_native_value(self, value: float) -> None:
         """Set new value."""
-        # TODO: Implement actual device control
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_set_config({self._number_type: value})
 
 
 class AthenaIntervalNumber(AthenaNumberEntity):
@@ -73,7 +83,7 @@ class AthenaIntervalNumber(AthenaNumberEntity):
 
     def __init__(self, coordinator: AthenaDataUpdateCoordinator) -> None:
         """Initialize the interval number."""
-        super().__init__(coordinator, "interval")
+        super().__init__(coordinator, NUMBER_INTERVAL)
         self._attr_name = "Athena Interval"
         self._attr_native_min_value = 10
         self._attr_native_max_value = 300
@@ -85,9 +95,8 @@ class AthenaIntervalNumber(AthenaNumberEntity):
     @property
     def native_value(self) -> float | None:
         """Return the entity value to represent the entity state."""
-        return self.coordinator.data.get("interval", 60)
+        return self.coordinator.data.get(NUMBER_INTERVAL, 60)
 
     async def async_set_native_value(self, value: float) -> None:
         """Set new value."""
-        # TODO: Implement actual device control
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_set_config({self._number_type: value})
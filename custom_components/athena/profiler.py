@@ -0,0 +1,130 @@
+"""Refresh and state-write timing for Athena integration."""
+from __future__ import annotations
+
+import asyncio
+import cProfile
+import logging
+import time
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+# Shared by every coordinator with profiling off; entering it costs next to nothing
+NULL_PHASE: AbstractContextManager[None] = nullcontext()
+
+# cProfile hooks the whole interpreter, so only one refresh is captured at a time
+_cprofile_owner: AthenaRefreshProfiler | None = None
+
+
+class _PhaseStats:
+    """Accumulated timings of one phase."""
+
+    __slots__ = ("count", "total", "max", "last")
+
+    def __init__(self) -> None:
+        """Initialize the stats."""
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.last = 0.0
+
+    def add(self, elapsed: float) -> None:
+        """Add one measurement."""
+        self.count += 1
+        self.total += elapsed
+        self.last = elapsed
+        self.max = max(self.max, elapsed)
+
+
+class AthenaRefreshProfiler:
+    """Time each phase of a refresh, from fetch to per-platform state writes.
+
+    Phases are ``fetch``, ``decode``, ``snapshot``, ``derived``, ``listeners`` and one
+    ``write_<platform>`` per entity platform. ``refresh`` covers the update
+    method and ``listeners`` the fan-out that follows it, including the state
+    writes, which are broken down per platform.
+
+    When ``cprofile_refreshes`` is set, the next that many refreshes also run
+    under cProfile and the stats are dumped to ``dump_path`` in pstats format.
+    Refreshes that start while another entry's refresh is being captured, or
+    while some other profiler is active, are not captured.
+    """
+
+    def __init__(self, cprofile_refreshes: int = 0, dump_path: str | None = None) -> None:
+        """Initialize the profiler."""
+        self.phases: dict[str, _PhaseStats] = {}
+        self.refreshes = 0
+        self.dump_path = dump_path
+        self._cprofile_remaining = cprofile_refreshes if dump_path else 0
+        self._cprofile: cProfile.Profile | None = None
+        self._refresh_started: float | None = None
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as phase ``name``."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            if (stats := self.phases.get(name)) is None:
+                stats = self.phases[name] = _PhaseStats()
+            stats.add(time.perf_counter() - started)
+
+    def refresh_started(self) -> None:
+        """Mark the start of a refresh."""
+        global _cprofile_owner  # pylint: disable=global-statement
+        self._refresh_started = time.perf_counter()
+        if self._cprofile_remaining <= 0 or _cprofile_owner is not None:
+            return
+        if self._cprofile is None:
+            self._cprofile = cProfile.Profile()
+        try:
+            self._cprofile.enable()
+        except ValueError as ex:
+            # Python 3.12+ refuses while another profiling tool is active
+            _LOGGER.debug("Not capturing refresh with cProfile: %s", ex)
+            return
+        _cprofile_owner = self
+
+    def refresh_finished(self) -> None:
+        """Mark the end of a refresh, successful or not."""
+        global _cprofile_owner  # pylint: disable=global-statement
+        if self._refresh_started is None:
+            return
+        self.refreshes += 1
+        self.phases.setdefault("refresh", _PhaseStats()).add(
+            time.perf_counter() - self._refresh_started
+        )
+        self._refresh_started = None
+        
+        if _cprofile_owner is not self:
+            return
+        _cprofile_owner = None
+        self._cprofile.disable()
+        self._cprofile_remaining -= 1
+        if self._cprofile_remaining == 0:
+            profile, self._cprofile = self._cprofile, None
+            asyncio.get_running_loop().run_in_executor(None, self._dump, profile)
+
+    def _dump(self, profile: cProfile.Profile) -> None:
+        """Write collected cProfile stats to disk."""
+        profile.dump_stats(self.dump_path)
+        _LOGGER.info("Wrote refresh profile to %s", self.dump_path)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a summary of all phases in milliseconds."""
+        return {
+            "refreshes": self.refreshes,
+            "cprofile_pending": self._cprofile_remaining,
+            "phases": {
+                name: {
+                    "count": stats.count,
+                    "mean_ms": round(stats.total / stats.count * 1000, 3),
+                    "max_ms": round(stats.max * 1000, 3),
+                    "last_ms": round(stats.last * 1000, 3),
+                }
+                for name, stats in self.phases.items()
+            },
+        }
@@ -0,0 +1,131 @@
+"""Desired-state reconciliation for Athena device configuration."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .api import AthenaAPIClient
+from .const import (
+    DOMAIN,
+    RECONCILE_MAX_RETRY,
+    RECONCILE_MIN_RETRY,
+    SELECT_MODE,
+    SELECT_PROFILE,
+    STORAGE_VERSION,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+SAVE_DELAY = 1
+
+
+def desired_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    """Return the store holding an entry's desired configuration."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.desired")
+
+
+class AthenaReconciler:
+    """Remember the requested configuration and converge the device onto it.
+
+    Every configuration change made through Home Assistant is persisted. After
+    each snapshot the device's values are compared against that desired state
+    and only the keys that drifted are pushed back: threshold and interval in
+    a single ``/api/config`` request, mode and profile through their own
+    endpoints. Attempts back off exponentially with jitter for as long as the
+    drift persists, whether the device rejected the change or accepted it
+    without applying it, so a fleet coming back online at once spreads its
+    corrections out instead of hammering every device.
+    """
+
+    def __init__(self, hass: HomeAssistant, api: AthenaAPIClient, entry_id: str) -> None:
+        """Initialize the reconciler."""
+        self.hass = hass
+        self.api = api
+        self.desired: dict[str, Any] = {}
+        self._store = desired_store(hass, entry_id)
+        # Attempts since the device last matched the desired state
+        self._attempts = 0
+        self._next_attempt = 0.0
+        self._in_flight = False
+
+    async def async_load(self) -> None:
+        """Load the persisted desired state."""
+        self.desired = await self._store.async_load() or {}
+
+    async def async_flush(self) -> None:
+        """Write the desired state now instead of after the save delay."""
+        await self._store.async_save(dict(self.desired))
+
+    async def async_remove(self) -> None:
+        """Delete the persisted desired state, dropping any pending save."""
+        await self._store.async_remove()
+
+    def diff(self, snapshot: dict[str, Any]) -> dict[str, Any]:
+        """Return the desired keys the snapshot disagrees with."""
+        return {
+            key: value
+            for key, value in self.desired.items()
+            if snapshot.get(key) != value
+        }
+
+    async def async_set(self, changes: dict[str, Any]) -> bool:
+        """Record new desired values and push them to the device right away."""
+        self.desired.update(changes)
+        self._store.async_delay_save(lambda: dict(self.desired), SAVE_DELAY)
+        self._attempts = 0
+        return await self.async_apply(changes)
+
+    async def async_apply(self, changes: dict[str, Any]) -> bool:
+        """Send a batch of changes and schedule the next allowed attempt.
+
+        The backoff only resets once a snapshot shows no drift, so a change
+        the device acknowledges but never applies is retried ever more slowly
+        instead of every poll.
+        """
+        self._in_flight = True
+        try:
+            success = await self._async_send(changes)
+        finally:
+            self._in_flight = False
+        
+        delay = min(RECONCILE_MIN_RETRY * 2 ** self._attempts, RECONCILE_MAX_RETRY)
+        self._attempts += 1
+        # Jitter keeps a recovering fleet from retrying in lockstep
+        self._next_attempt = time.monotonic() + delay * random.uniform(0.5, 1.0)
+        return success
+
+    async def _async_send(self, changes: dict[str, Any]) -> bool:
+        """Send each change to the endpoint that handles it."""
+        config = {
+            key: value
+            for key, value in changes.items()
+            if key not in (SELECT_MODE, SELECT_PROFILE)
+        }
+        requests = []
+        if config:
+            requests.append(self.api.set_config(config))
+        if SELECT_MODE in changes:
+            requests.append(self.api.set_mode(changes[SELECT_MODE]))
+        if SELECT_PROFILE in changes:
+            requests.append(self.api.set_profile(changes[SELECT_PROFILE]))
+        return all(await asyncio.gather(*requests))
+
+    @callback
+    def async_reconcile(self, snapshot: dict[str, Any]) -> None:
+        """Correct any drift between the snapshot and the desired state."""
+        if not (drift := self.diff(snapshot)):
+            self._attempts = 0
+            return
+        if self._in_flight or time.monotonic() < self._next_attempt:
+            return
+        
+        _LOGGER.debug(
+            "Reconciling %s on %s (attempt %s)", drift, self.api.host, self._attempts + 1
+        )
+        self.hass.async_create_task(self.async_apply(drift))
@@ -3,11 +3,11 @@ from __future__ import annotations
 
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import DOMAIN, MODE_OPTIONS, PROFILE_OPTIONS, SELECT_MODE, SELECT_PROFILE
 from .coordinator import AthenaDataUpdateCoordinator
 
 
@@ -43,26 +43,36 @@ class AthenaSelectEntity(CoordinatorEntity, SelectEntity):
             "sw_version": coordinator.data.get("device_info", {}).get("firmware_version", "Unknown"),
         }
 
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        return super().available and self.coordinator.device_available
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        with self.coordinator.phase("write_select"):
+            super()._handle_coordinator_update()
+
 
 class AthenaModeSelect(AthenaSelectEntity):
     """Mode select entity for Athena device."""
 
     def __init__(self, coordinator: AthenaDataUpdateCoordinator) -> None:
         """Initialize the mode select."""
-        super().__init__(coordinator, "mode")
+        super().__init__(coordinator, SELECT_MODE)
         self._attr_name = "Athena Mode"
-        self._attr_options = ["manual", "automatic", "scheduled", "maintenance"]
+        self._attr_options = MODE_OPTIONS
         self._attr_icon = "mdi:cog"
 
     @property
     def current_option(self) -> str | None:
         """Return the selected entity option to represent the entity state."""
-        return self.coordinator.data.get("mode", "automatic")
+        return self.coordinator.data.get(SELECT_MODE, "automatic")
 
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
-        # TODO: Implement actual device control
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_set_config({self._select_type: option})
 
 
 class AthenaProfileSelect(AthenaSelectEntity):
@@ -70,17 +80,16 @@ class AthenaProfileSelect(AthenaSelectEntity):
 
     def __init__(self, coordinator: AthenaDataUpdateCoordinator) -> None:
         """Initialize the profile select."""
-        super().__init__(coordinator, "profile")
+        super().__init__(coordinator, SELECT_PROFILE)
         self._attr_name = "Athena Profile"
-        self._attr_options = ["eco", "normal", "performance", "custom"]
+        self._attr_options = PROFILE_OPTIONS
         self._attr_icon = "mdi:account-settings"
 
     @property
     def current_option(self) -> str | None:
         """Return the selected entity option to represent the entity state."""
-        return self.coordinator.data.get("profile", "normal")
+        return self.coordinator.data.get(SELECT_PROFILE, "normal")
 
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
-        # TODO: Implement actual device control
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_set_config({self._select_type: option})
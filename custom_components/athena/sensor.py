@@ -8,24 +8,52 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
+    CONCENTRATION_GRAMS_PER_CUBIC_METER,
     PERCENTAGE,
     SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
     UnitOfPressure,
     UnitOfTemperature,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     DOMAIN,
+    SENSOR_ABSOLUTE_HUMIDITY,
+    SENSOR_DEW_POINT,
+    SENSOR_HEAT_INDEX,
     SENSOR_HUMIDITY,
     SENSOR_PRESSURE,
+    SENSOR_PRESSURE_TREND,
     SENSOR_SIGNAL_STRENGTH,
     SENSOR_STATUS,
     SENSOR_TEMPERATURE,
 )
 from .coordinator import AthenaDataUpdateCoordinator
+from .derived import channel_readings
+
+# Derived metrics exposed per channel: name, device class, unit, icon
+CHANNEL_METRICS = {
+    SENSOR_DEW_POINT: (
+        "Dew Point",
+        SensorDeviceClass.TEMPERATURE,
+        UnitOfTemperature.CELSIUS,
+        None,
+    ),
+    SENSOR_ABSOLUTE_HUMIDITY: (
+        "Absolute Humidity",
+        None,
+        CONCENTRATION_GRAMS_PER_CUBIC_METER,
+        "mdi:water",
+    ),
+    SENSOR_HEAT_INDEX: (
+        "Heat Index",
+        SensorDeviceClass.TEMPERATURE,
+        UnitOfTemperature.CELSIUS,
+        None,
+    ),
+}
 
 
 async def async_setup_entry(
@@ -42,7 +70,17 @@ async def async_setup_entry(
         AthenaPressureSensor(coordinator),
         AthenaSignalStrengthSensor(coordinator),
         AthenaStatusSensor(coordinator),
+        AthenaDewPointSensor(coordinator),
+        AthenaAbsoluteHumiditySensor(coordinator),
+        AthenaHeatIndexSensor(coordinator),
+        AthenaPressureTrendSensor(coordinator),
     ]
+    # Multi-channel devices get derived sensors for every channel
+    for index, channel in enumerate(channel_readings(coordinator.data)):
+        entities.extend(
+            AthenaChannelDerivedSensor(coordinator, index, channel.get("name"), metric)
+            for metric in CHANNEL_METRICS
+        )
 
     async_add_entities(entities)
 
@@ -63,6 +101,17 @@ class AthenaSensorEntity(CoordinatorEntity, SensorEntity):
             "sw_version": coordinator.data.get("device_info", {}).get("firmware_version", "Unknown"),
         }
 
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        return super().available and self.coordinator.device_available
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        with self.coordinator.phase("write_sensor"):
+            super()._handle_coordinator_update()
+
 
 class AthenaTemperatureSensor(AthenaSensorEntity):
     """Temperature sensor for Athena device."""
@@ -144,3 +193,101 @@ class AthenaStatusSensor(AthenaSensorEntity):
     def native_value(self) -> str | None:
         """Return the state of the sensor."""
         return self.coordinator.data.get("status")
+
+
+class AthenaDewPointSensor(AthenaSensorEntity):
+    """Dew point sensor derived from temperature and humidity."""
+
+    def __init__(self, coordinator: AthenaDataUpdateCoordinator) -> None:
+        """Initialize the dew point sensor."""
+        super().__init__(coordinator, SENSOR_DEW_POINT)
+        self._attr_name = "Athena Dew Point"
+        self._attr_device_class = SensorDeviceClass.TEMPERATURE
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+        self._attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the state of the sensor."""
+        return self.coordinator.data.get(SENSOR_DEW_POINT)
+
+
+class AthenaAbsoluteHumiditySensor(AthenaSensorEntity):
+    """Absolute humidity sensor derived from temperature and humidity."""
+
+    def __init__(self, coordinator: AthenaDataUpdateCoordinator) -> None:
+        """Initialize the absolute humidity sensor."""
+        super().__init__(coordinator, SENSOR_ABSOLUTE_HUMIDITY)
+        self._attr_name = "Athena Absolute Humidity"
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+        self._attr_native_unit_of_measurement = CONCENTRATION_GRAMS_PER_CUBIC_METER
+        self._attr_icon = "mdi:water"
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the state of the sensor."""
+        return self.coordinator.data.get(SENSOR_ABSOLUTE_HUMIDITY)
+
+
+class AthenaHeatIndexSensor(AthenaSensorEntity):
+    """Heat index sensor derived from temperature and humidity."""
+
+    def __init__(self, coordinator: AthenaDataUpdateCoordinator) -> None:
+        """Initialize the heat index sensor."""
+        super().__init__(coordinator, SENSOR_HEAT_INDEX)
+        self._attr_name = "Athena Heat Index"
+        self._attr_device_class = SensorDeviceClass.TEMPERATURE
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+        self._attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the state of the sensor."""
+        return self.coordinator.data.get(SENSOR_HEAT_INDEX)
+
+
+class AthenaPressureTrendSensor(AthenaSensorEntity):
+    """Pressure trend sensor, the pressure change over the last three hours."""
+
+    def __init__(self, coordinator: AthenaDataUpdateCoordinator) -> None:
+        """Initialize the pressure trend sensor."""
+        super().__init__(coordinator, SENSOR_PRESSURE_TREND)
+        self._attr_name = "Athena Pressure Trend"
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+        self._attr_native_unit_of_measurement = UnitOfPressure.HPA
+        self._attr_icon = "mdi:trending-up"
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the state of the sensor."""
+        return self.coordinator.data.get(SENSOR_PRESSURE_TREND)
+
+
+class AthenaChannelDerivedSensor(AthenaSensorEntity):
+    """Dew point, absolute humidity or heat index of one channel."""
+
+    def __init__(
+        self,
+        coordinator: AthenaDataUpdateCoordinator,
+        index: int,
+        channel_name: str | None,
+        metric: str,
+    ) -> None:
+        """Initialize the channel sensor."""
+        super().__init__(coordinator, f"channel_{index}_{metric}")
+        self._index = index
+        self._metric = metric
+        name, device_class, unit, icon = CHANNEL_METRICS[metric]
+        self._attr_name = f"Athena {channel_name or f'Channel {index + 1}'} {name}"
+        self._attr_device_class = device_class
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+        self._attr_native_unit_of_measurement = unit
+        self._attr_icon = icon
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the state of the sensor."""
+        channels = channel_readings(self.coordinator.data)
+        if self._index >= len(channels):
+            return None
+        return channels[self._index].get(self._metric)
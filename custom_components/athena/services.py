@@ -0,0 +1,182 @@
+"""Fleet-wide services for Athena integration."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.helpers import config_validation as cv
+
+from .const import (
+    ATTR_CONFIG,
+    ATTR_CONFIG_ENTRY_ID,
+    ATTR_DURATION,
+    ATTR_PROFILE,
+    ATTR_STATE,
+    DOMAIN,
+    FLEET_CONCURRENCY,
+    FLEET_DEVICE_TIMEOUT,
+    MODE_OPTIONS,
+    NUMBER_INTERVAL,
+    NUMBER_THRESHOLD,
+    PROFILE_OPTIONS,
+    SELECT_MODE,
+    SELECT_PROFILE,
+    SERVICE_APPLY_PROFILE,
+    SERVICE_MEMORY_REPORT,
+    SERVICE_SET_CONFIG,
+    SERVICE_SET_POWER,
+)
+from .coordinator import AthenaDataUpdateCoordinator
+from .memory import async_memory_report
+
+_LOGGER = logging.getLogger(__name__)
+
+TARGET_SCHEMA = {
+    vol.Optional(ATTR_CONFIG_ENTRY_ID): vol.All(cv.ensure_list, [cv.string]),
+}
+
+APPLY_PROFILE_SCHEMA = vol.Schema(
+    {
+        **TARGET_SCHEMA,
+        vol.Required(ATTR_PROFILE): vol.In(PROFILE_OPTIONS),
+    }
+)
+
+SET_CONFIG_SCHEMA = vol.Schema(
+    {
+        **TARGET_SCHEMA,
+        vol.Required(ATTR_CONFIG): vol.All(
+            vol.Schema(
+                {
+                    vol.Optional(NUMBER_THRESHOLD): vol.All(
+                        vol.Coerce(float), vol.Range(min=0, max=100)
+                    ),
+                    vol.Optional(NUMBER_INTERVAL): vol.All(
+                        vol.Coerce(float), vol.Range(min=10, max=300)
+                    ),
+                    vol.Optional(SELECT_MODE): vol.In(MODE_OPTIONS),
+                    vol.Optional(SELECT_PROFILE): vol.In(PROFILE_OPTIONS),
+                }
+            ),
+            vol.Length(min=1),
+        ),
+    }
+)
+
+SET_POWER_SCHEMA = vol.Schema(
+    {
+        **TARGET_SCHEMA,
+        vol.Required(ATTR_STATE): cv.boolean,
+    }
+)
+
+MEMORY_REPORT_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_DURATION, default=10): vol.All(
+            vol.Coerce(float), vol.Range(min=0, max=300)
+        ),
+    }
+)
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the fleet-wide Athena services."""
+    # Shared by every service call so concurrent calls can't multiply the load
+    semaphore = asyncio.Semaphore(FLEET_CONCURRENCY)
+
+    async def _async_fan_out(
+        call: ServiceCall,
+        action: Callable[[AthenaDataUpdateCoordinator], Awaitable[bool]],
+    ) -> ServiceResponse:
+        """Run an action against every targeted device and collect the results."""
+        coordinators = _get_coordinators(hass, call)
+
+        async def _async_run(coordinator: AthenaDataUpdateCoordinator) -> dict[str, Any]:
+            async with semaphore:
+                try:
+                    success = await asyncio.wait_for(
+                        action(coordinator), FLEET_DEVICE_TIMEOUT
+                    )
+                except asyncio.TimeoutError:
+                    return {"success": False, "error": "timeout"}
+                except Exception as ex:  # pylint: disable=broad-except
+                    _LOGGER.debug("%s failed on %s: %s", call.service, coordinator.host, ex)
+                    return {"success": False, "error": str(ex)}
+            return {"success": success}
+
+        results = await asyncio.gather(*(_async_run(c) for c in coordinators))
+
+        # One refresh per device once the whole fleet has been changed, rather
+        # than a refresh after every individual command.
+        for coordinator in coordinators:
+            hass.async_create_task(coordinator.async_request_refresh())
+
+        return {
+            "results": {
+                coordinator.entry.entry_id: {"title": coordinator.entry.title, **result}
+                for coordinator, result in zip(coordinators, results)
+            }
+        }
+
+    async def async_apply_profile(call: ServiceCall) -> ServiceResponse:
+        """Apply a profile to many devices."""
+        changes = {SELECT_PROFILE: call.data[ATTR_PROFILE]}
+        return await _async_fan_out(call, lambda c: c.reconciler.async_set(changes))
+
+    async def async_set_config(call: ServiceCall) -> ServiceResponse:
+        """Set configuration values on many devices."""
+        changes = call.data[ATTR_CONFIG]
+        return await _async_fan_out(call, lambda c: c.reconciler.async_set(changes))
+
+    async def async_set_power(call: ServiceCall) -> ServiceResponse:
+        """Switch power on many devices."""
+        state = call.data[ATTR_STATE]
+        return await _async_fan_out(call, lambda c: c.api.set_power(state))
+
+    for service, handler, schema in (
+        (SERVICE_APPLY_PROFILE, async_apply_profile, APPLY_PROFILE_SCHEMA),
+        (SERVICE_SET_CONFIG, async_set_config, SET_CONFIG_SCHEMA),
+        (SERVICE_SET_POWER, async_set_power, SET_POWER_SCHEMA),
+    ):
+        hass.services.async_register(
+            DOMAIN,
+            service,
+            handler,
+            schema=schema,
+            supports_response=SupportsResponse.OPTIONAL,
+        )
+
+    async def async_memory_report_service(call: ServiceCall) -> ServiceResponse:
+        """Report per-entry memory usage."""
+        return await async_memory_report(hass, call.data[ATTR_DURATION])
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_MEMORY_REPORT,
+        async_memory_report_service,
+        schema=MEMORY_REPORT_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+
+@callback
+def _get_coordinators(
+    hass: HomeAssistant, call: ServiceCall
+) -> list[AthenaDataUpdateCoordinator]:
+    """Return the loaded coordinators targeted by a service call."""
+    loaded = hass.data.get(DOMAIN, {})
+    if (entry_ids := call.data.get(ATTR_CONFIG_ENTRY_ID)) is None:
+        return list(loaded.values())
+    return [loaded[entry_id] for entry_id in entry_ids if entry_id in loaded]
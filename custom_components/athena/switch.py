@@ -5,7 +5,7 @@ from typing import Any
 
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -45,6 +45,17 @@ class AthenaSwitchEntity(CoordinatorEntity, SwitchEntity):
             "sw_version": coordinator.data.get("device_info", {}).get("firmware_version", "Unknown"),
         }
 
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        return super().available and self.coordinator.device_available
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        with self.coordinator.phase("write_switch"):
+            super()._handle_coordinator_update()
+
 
 class AthenaPowerSwitch(AthenaSwitchEntity):
     """Power switch for Athena device."""
@@ -0,0 +1,159 @@
+"""Websocket API for live Athena dashboards."""
+from __future__ import annotations
+
+import time
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import DEFAULT_WS_THROTTLE, DOMAIN
+from .coordinator import AthenaDataUpdateCoordinator
+
+ATTR_AVAILABLE = "available"
+
+# Marks keys a client has not been sent yet, so None is still delivered
+_MISSING = object()
+
+
+@callback
+def async_register_websocket_commands(hass: HomeAssistant) -> None:
+    """Register the Athena websocket commands."""
+    websocket_api.async_register_command(hass, websocket_subscribe)
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "athena/subscribe",
+        vol.Optional("entry_ids"): [str],
+        vol.Optional("keys"): [str],
+        vol.Optional("throttle", default=DEFAULT_WS_THROTTLE): vol.All(
+            vol.Coerce(float), vol.Range(min=0)
+        ),
+    }
+)
+@callback
+def websocket_subscribe(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Stream snapshot deltas for the chosen devices and keys."""
+    loaded: dict[str, AthenaDataUpdateCoordinator] = hass.data.get(DOMAIN, {})
+    entry_ids = msg.get("entry_ids", list(loaded))
+
+    subscription = AthenaSubscription(
+        hass, connection, msg["id"], msg.get("keys"), msg["throttle"]
+    )
+    for entry_id in entry_ids:
+        if (coordinator := loaded.get(entry_id)) is not None:
+            subscription.async_track(entry_id, coordinator)
+
+    connection.subscriptions[msg["id"]] = subscription.async_unsubscribe
+    connection.send_result(msg["id"])
+    subscription.async_flush()
+
+
+class AthenaSubscription:
+    """One client's view of many devices, throttled and conflated.
+
+    Changes are merged into a single pending delta per device; at most one
+    event is sent per throttle window. A slow client therefore only ever gets
+    the latest values instead of a growing backlog, however many devices it
+    follows.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        connection: websocket_api.ActiveConnection,
+        msg_id: int,
+        keys: list[str] | None,
+        throttle: float,
+    ) -> None:
+        """Initialize the subscription."""
+        self.hass = hass
+        self.connection = connection
+        self.msg_id = msg_id
+        self.keys = set(keys) if keys else None
+        self.throttle = throttle
+        self._sent: dict[str, dict[str, Any]] = {}
+        self._pending: dict[str, dict[str, Any]] = {}
+        self._last_flush = 0.0
+        self._unsub_timer: CALLBACK_TYPE | None = None
+        self._unsubs: list[CALLBACK_TYPE] = []
+
+    @callback
+    def async_track(self, entry_id: str, coordinator: AthenaDataUpdateCoordinator) -> None:
+        """Follow a device, queueing its current values.
+
+        Observers move to the new coordinator when the entry reloads, and are
+        handed whichever coordinator is updating, so values never go stale.
+        """
+        self._sent[entry_id] = {}
+
+        @callback
+        def _async_updated(current: AthenaDataUpdateCoordinator) -> None:
+            self._async_collect(entry_id, current)
+            self._async_schedule_flush()
+
+        self._unsubs.append(coordinator.async_add_observer(_async_updated))
+        self._async_collect(entry_id, coordinator)
+
+    @callback
+    def _async_collect(self, entry_id: str, coordinator: AthenaDataUpdateCoordinator) -> None:
+        """Merge the values that changed since the last send into the pending delta."""
+        values = {
+            **(coordinator.data or {}),
+            ATTR_AVAILABLE: coordinator.last_update_success and coordinator.device_available,
+        }
+        sent = self._sent[entry_id]
+        delta = {
+            key: value
+            for key, value in values.items()
+            if (self.keys is None or key in self.keys) and sent.get(key, _MISSING) != value
+        }
+        if delta:
+            self._pending.setdefault(entry_id, {}).update(delta)
+
+    @callback
+    def _async_schedule_flush(self) -> None:
+        """Flush now, or once the throttle window has passed."""
+        if self._unsub_timer is not None or not self._pending:
+            return
+        remaining = self._last_flush + self.throttle - time.monotonic()
+        if remaining <= 0:
+            self.async_flush()
+        else:
+            self._unsub_timer = async_call_later(self.hass, remaining, self._async_timer_flush)
+
+    @callback
+    def _async_timer_flush(self, _now: Any) -> None:
+        """Flush when the throttle window expires."""
+        self._unsub_timer = None
+        self.async_flush()
+
+    @callback
+    def async_flush(self) -> None:
+        """Send all pending deltas as one event."""
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, {}
+        for entry_id, delta in pending.items():
+            self._sent[entry_id].update(delta)
+        self._last_flush = time.monotonic()
+        self.connection.send_message(
+            websocket_api.event_message(self.msg_id, {"devices": pending})
+        )
+
+    @callback
+    def async_unsubscribe(self) -> None:
+        """Stop following all devices."""
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+        while self._unsubs:
+            self._unsubs.pop()()
@@ -0,0 +1,41 @@
+"""Fixtures for Athena integration tests."""
+from __future__ import annotations
+
+import resource
+from collections.abc import AsyncGenerator, Generator
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.athena.const import DOMAIN, PARKED_COORDINATORS
+
+from .fake_device import FakeAthenaDevices
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations: None) -> Generator[None]:
+    """Load the integration from custom_components in every test."""
+    yield
+
+
+@pytest.fixture
+async def fake_devices(
+    hass: HomeAssistant, socket_enabled: None
+) -> AsyncGenerator[FakeAthenaDevices]:
+    """Serve simulated devices and unload every entry afterwards."""
+    # Each device holds a listening socket plus both ends of a connection
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+
+    devices = FakeAthenaDevices()
+    yield devices
+
+    for entry in hass.config_entries.async_entries(DOMAIN):
+        await hass.config_entries.async_unload(entry.entry_id)
+    for coordinator, cancel_expire in hass.data.pop(PARKED_COORDINATORS, {}).values():
+        cancel_expire()
+        await coordinator.api.close()
+    await hass.async_block_till_done()
+    await devices.async_stop()
+    resource.setrlimit(resource.RLIMIT_NOFILE, (soft, hard))
@@ -0,0 +1,167 @@
+"""Fake Athena devices served from a local aiohttp server."""
+from __future__ import annotations
+
+import json
+import os
+import random
+import socket
+from collections import Counter
+from typing import Any
+
+import cbor2
+import msgpack
+from aiohttp import BasicAuth, hdrs, web
+
+CONTENT_TYPE_MSGPACK = "application/msgpack"
+CONTENT_TYPE_CBOR = "application/cbor"
+
+
+class FakeAthenaDevices:
+    """Any number of simulated Athena devices, one loopback port each.
+
+    Every device answers the endpoints the integration uses. The serial number
+    is derived from the port, so each device looks like distinct hardware.
+    Requests are counted per method and path.
+
+    Documents are encoded as MessagePack or CBOR when the client accepts it
+    and the encoding is listed in ``encodings``, otherwise as JSON, and gzip
+    compressed when ``compress`` is set. Served content types are counted.
+
+    With ``password`` set, logins and requests with any other password are
+    rejected with a 401. ``login_status`` makes /api/login answer with that
+    status instead, ``token_ttl`` sets the lifetime of issued tokens and
+    ``revoke_tokens`` invalidates every token handed out so far.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the fake devices."""
+        self.requests: Counter[tuple[str, str]] = Counter()
+        self.served: Counter[str] = Counter()
+        self.sensors: dict[str, Any] | None = None
+        self.encodings: set[str] = set()
+        self.compress = False
+        self.password: str | None = None
+        self.login_status: int | None = None
+        self.token_ttl: Any = 3600
+        self._tokens: set[str] = set()
+        self._runner: web.AppRunner | None = None
+
+    async def async_start(self, count: int) -> list[int]:
+        """Start serving ``count`` devices and return their ports."""
+        self._runner = web.AppRunner(self._make_app(), access_log=None)
+        await self._runner.setup()
+        ports = []
+        for _ in range(count):
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            sock.bind(("127.0.0.1", 0))
+            await web.SockSite(self._runner, sock).start()
+            ports.append(sock.getsockname()[1])
+        return ports
+
+    async def async_stop(self) -> None:
+        """Stop serving."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def revoke_tokens(self) -> None:
+        """Reject every token issued so far."""
+        self._tokens.clear()
+
+    def sensor_payload(self) -> dict[str, Any]:
+        """Return the next /api/sensors document."""
+        if self.sensors is not None:
+            return self.sensors
+        return {
+            "temperature": round(random.uniform(18, 28), 1),
+            "humidity": round(random.uniform(30, 60), 1),
+            "pressure": round(random.uniform(990, 1030), 2),
+            "signal_strength": random.randint(-90, -40),
+            "power": True,
+            "auto_mode": True,
+            "maintenance": False,
+        }
+
+    def respond(self, request: web.Request, document: Any) -> web.Response:
+        """Encode a document the way the client asked for."""
+        accept = request.headers.get("Accept", "")
+        if CONTENT_TYPE_MSGPACK in self.encodings and CONTENT_TYPE_MSGPACK in accept:
+            response = web.Response(
+                body=msgpack.packb(document), content_type=CONTENT_TYPE_MSGPACK
+            )
+        elif CONTENT_TYPE_CBOR in self.encodings and CONTENT_TYPE_CBOR in accept:
+            response = web.Response(body=cbor2.dumps(document), content_type=CONTENT_TYPE_CBOR)
+        else:
+            response = web.json_response(document)
+        if self.compress:
+            response.enable_compression(web.ContentCoding.gzip)
+        self.served[response.content_type] += 1
+        return response
+
+    def _make_app(self) -> web.Application:
+        """Build the aiohttp app shared by every device."""
+
+        @web.middleware
+        async def count(request: web.Request, handler: Any) -> web.StreamResponse:
+            self.requests[(request.method, request.path)] += 1
+            return await handler(request)
+
+        @web.middleware
+        async def authorize(request: web.Request, handler: Any) -> web.StreamResponse:
+            if (
+                self.password is None
+                or request.method == "HEAD"
+                or request.path == "/api/login"
+            ):
+                return await handler(request)
+            header = request.headers.get(hdrs.AUTHORIZATION, "")
+            if header.startswith("Bearer ") and header[7:] in self._tokens:
+                return await handler(request)
+            try:
+                if BasicAuth.decode(header).password == self.password:
+                    return await handler(request)
+            except ValueError:
+                pass
+            return web.Response(status=401)
+
+        async def info(request: web.Request) -> web.Response:
+            return self.respond(
+                request,
+                {
+                    "firmware_version": "1.2.3",
+                    "hardware_version": "2.1",
+                    "serial_number": f"SIM-{request.url.port}",
+                    "model": "Athena Simulator",
+                },
+            )
+
+        async def status(request: web.Request) -> web.Response:
+            if request.method == "HEAD":
+                return web.Response()
+            return self.respond(request, {"status": "online", "online": True, "fault": False})
+
+        async def sensors(request: web.Request) -> web.Response:
+            return self.respond(request, self.sensor_payload())
+
+        async def login(request: web.Request) -> web.Response:
+            if self.login_status is not None:
+                return web.Response(status=self.login_status)
+            credentials = json.loads(await request.read())
+            if self.password is not None and credentials.get("password") != self.password:
+                return web.Response(status=401)
+            token = os.urandom(8).hex()
+            self._tokens.add(token)
+            return web.json_response({"token": token, "expires_in": self.token_ttl})
+
+        async def accept(request: web.Request) -> web.Response:
+            return web.json_response({})
+
+        app = web.Application(middlewares=[count, authorize])
+        app.router.add_get("/api/info", info)
+        app.router.add_route("*", "/api/status", status)
+        app.router.add_get("/api/sensors", sensors)
+        app.router.add_post("/api/login", login)
+        for path in ("/api/config", "/api/mode", "/api/power", "/api/profile"):
+            app.router.add_post(path, accept)
+        return app
@@ -0,0 +1,72 @@
+"""Tests for the Athena API client against fake devices."""
+from __future__ import annotations
+
+import pytest
+
+from custom_components.athena.api import AthenaAPIClient
+
+from .fake_device import CONTENT_TYPE_CBOR, CONTENT_TYPE_MSGPACK, FakeAthenaDevices
+
+SENSORS = {"temperature": 21.5, "humidity": 45.0, "pressure": 1013.25, "power": True}
+
+
+@pytest.mark.parametrize(
+    ("encodings", "content_type"),
+    [
+        (set(), "application/json"),
+        ({CONTENT_TYPE_MSGPACK}, CONTENT_TYPE_MSGPACK),
+        ({CONTENT_TYPE_CBOR}, CONTENT_TYPE_CBOR),
+        ({CONTENT_TYPE_MSGPACK, CONTENT_TYPE_CBOR}, CONTENT_TYPE_MSGPACK),
+    ],
+)
+@pytest.mark.parametrize("compress", [False, True])
+async def test_negotiates_encoding(
+    fake_devices: FakeAthenaDevices,
+    encodings: set[str],
+    content_type: str,
+    compress: bool,
+) -> None:
+    """The client decodes whichever encoding the device picks, compressed or not."""
+    fake_devices.sensors = SENSORS
+    fake_devices.encodings = encodings
+    fake_devices.compress = compress
+    (port,) = await fake_devices.async_start(1)
+    client = AthenaAPIClient("127.0.0.1", port, "admin", "admin")
+    try:
+        assert await client.get_sensor_data() == SENSORS
+        assert await client.get_sensor_data(["temperature"]) == {"temperature": 21.5}
+    finally:
+        await client.close()
+
+    assert fake_devices.served == {content_type: 2}
+
+
+@pytest.mark.parametrize("compress", [False, True])
+async def test_large_json_keeps_selected_keys(
+    fake_devices: FakeAthenaDevices, compress: bool
+) -> None:
+    """Documents above the streaming threshold are parsed down to the wanted keys."""
+    history = [round(i * 0.01, 2) for i in range(100_000)]
+    fake_devices.sensors = {**SENSORS, "history": history}
+    fake_devices.compress = compress
+    (port,) = await fake_devices.async_start(1)
+    client = AthenaAPIClient("127.0.0.1", port, "admin", "admin")
+    try:
+        assert await client.get_sensor_data(["temperature", "power"]) == {
+            "temperature": 21.5,
+            "power": True,
+        }
+        assert (await client.get_sensor_data())["history"] == history
+    finally:
+        await client.close()
+
+
+async def test_non_object_body_is_empty(fake_devices: FakeAthenaDevices) -> None:
+    """A document that is not a JSON object decodes to an empty mapping."""
+    fake_devices.sensors = [1, 2, 3]
+    (port,) = await fake_devices.async_start(1)
+    client = AthenaAPIClient("127.0.0.1", port, "admin", "admin")
+    try:
+        assert await client.get_sensor_data() == {}
+    finally:
+        await client.close()
@@ -0,0 +1,81 @@
+"""Tests for Athena token authentication against fake devices."""
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from custom_components.athena.api import AthenaAPIClient
+from custom_components.athena.auth import AUTH_MODE_BASIC, AUTH_MODE_TOKEN
+
+from .fake_device import FakeAthenaDevices
+
+LOGIN = ("POST", "/api/login")
+
+
+@pytest.mark.parametrize("token_ttl", [3600, 10, "soon", None])
+async def test_logs_in_once(fake_devices: FakeAthenaDevices, token_ttl: Any) -> None:
+    """The token is reused, even a short-lived one or one with a bogus lifetime."""
+    fake_devices.password = "secret"
+    fake_devices.token_ttl = token_ttl
+    (port,) = await fake_devices.async_start(1)
+    client = AthenaAPIClient("127.0.0.1", port, "admin", "secret")
+    try:
+        for _ in range(3):
+            assert await client.get_status()
+        assert client._auth.mode == AUTH_MODE_TOKEN
+    finally:
+        await client.close()
+
+    assert fake_devices.requests[LOGIN] == 1
+    assert fake_devices.requests[("GET", "/api/status")] == 3
+
+
+async def test_relogs_in_once_after_401(fake_devices: FakeAthenaDevices) -> None:
+    """A rejected token triggers one login and the request is retried."""
+    fake_devices.password = "secret"
+    (port,) = await fake_devices.async_start(1)
+    client = AthenaAPIClient("127.0.0.1", port, "admin", "secret")
+    try:
+        assert await client.get_status()
+        fake_devices.revoke_tokens()
+        assert await client.get_status()
+    finally:
+        await client.close()
+
+    assert fake_devices.requests[LOGIN] == 2
+    assert fake_devices.requests[("GET", "/api/status")] == 3
+
+
+async def test_concurrent_401s_share_one_login(fake_devices: FakeAthenaDevices) -> None:
+    """Requests rejected together wait for a single re-login."""
+    fake_devices.password = "secret"
+    (port,) = await fake_devices.async_start(1)
+    client = AthenaAPIClient("127.0.0.1", port, "admin", "secret")
+    try:
+        assert await client.get_status()
+        fake_devices.revoke_tokens()
+        results = await asyncio.gather(*(client.get_status() for _ in range(5)))
+        assert all(results)
+    finally:
+        await client.close()
+
+    assert fake_devices.requests[LOGIN] == 2
+
+
+async def test_falls_back_to_basic_auth(fake_devices: FakeAthenaDevices) -> None:
+    """Firmware without /api/login is sent Basic auth and not asked again."""
+    fake_devices.password = "secret"
+    fake_devices.login_status = 404
+    (port,) = await fake_devices.async_start(1)
+    client = AthenaAPIClient("127.0.0.1", port, "admin", "secret")
+    try:
+        for _ in range(3):
+            assert await client.get_status()
+        assert client._auth.mode == AUTH_MODE_BASIC
+    finally:
+        await client.close()
+
+    assert fake_devices.requests[LOGIN] == 1
+    assert fake_devices.requests[("GET", "/api/status")] == 3
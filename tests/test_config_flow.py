@@ -0,0 +1,74 @@
+"""Tests for the Athena config flow."""
+from __future__ import annotations
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant import config_entries
+from homeassistant.core import HomeAssistant
+from homeassistant.data_entry_flow import FlowResultType
+
+from custom_components.athena.const import DOMAIN
+
+from .fake_device import FakeAthenaDevices
+
+
+def _user_input(port: int, password: str = "secret") -> dict:
+    """Return config flow input for a fake device."""
+    return {
+        "host": "127.0.0.1",
+        "port": port,
+        "username": "admin",
+        "password": password,
+        "device_type": "controller",
+        "scan_interval": 30,
+    }
+
+
+async def test_wrong_password_is_invalid_auth(
+    hass: HomeAssistant, fake_devices: FakeAthenaDevices
+) -> None:
+    """A device rejecting the credentials is reported as invalid_auth."""
+    fake_devices.password = "secret"
+    (port,) = await fake_devices.async_start(1)
+
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN,
+        context={"source": config_entries.SOURCE_USER},
+        data=_user_input(port, password="wrong"),
+    )
+
+    assert result["type"] is FlowResultType.FORM
+    assert result["errors"] == {"base": "invalid_auth"}
+
+
+async def test_unreachable_device_cannot_connect(
+    hass: HomeAssistant, fake_devices: FakeAthenaDevices
+) -> None:
+    """A device that doesn't answer is reported as cannot_connect."""
+    (port,) = await fake_devices.async_start(1)
+    await fake_devices.async_stop()
+
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}, data=_user_input(port)
+    )
+
+    assert result["type"] is FlowResultType.FORM
+    assert result["errors"] == {"base": "cannot_connect"}
+
+
+async def test_entry_with_old_unique_id_is_detected(
+    hass: HomeAssistant, fake_devices: FakeAthenaDevices
+) -> None:
+    """A device already added under the host-based unique ID is not added again."""
+    (port,) = await fake_devices.async_start(1)
+    MockConfigEntry(
+        domain=DOMAIN, unique_id="127.0.0.1_controller", data=_user_input(port)
+    ).add_to_hass(hass)
+
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}, data=_user_input(port)
+    )
+
+    assert result["type"] is FlowResultType.ABORT
+    assert result["reason"] == "already_configured"
+    assert not fake_devices.requests
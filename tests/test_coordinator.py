@@ -0,0 +1,64 @@
+"""Tests for the Athena data update coordinator."""
+from __future__ import annotations
+
+from datetime import timedelta
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.athena.const import ALIGN_MIN_DELAY, DOMAIN
+
+from .fake_device import FakeAthenaDevices
+
+SCAN_INTERVAL = timedelta(seconds=30)
+
+
+async def test_align_polling_backs_off(
+    hass: HomeAssistant, fake_devices: FakeAthenaDevices
+) -> None:
+    """Aligned polls follow the device, but not into a tight loop."""
+    fake_devices.sensors = {"seq": 1, "interval": 60, "temperature": 21.0}
+    (port,) = await fake_devices.async_start(1)
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        unique_id="align",
+        data={
+            "host": "127.0.0.1",
+            "port": port,
+            "username": "admin",
+            "password": "admin",
+            "device_type": "controller",
+            "scan_interval": SCAN_INTERVAL.seconds,
+        },
+        options={"align_polling": True},
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+
+    # A fresh sample: poll just after the next one is due
+    assert coordinator.update_interval.total_seconds() == pytest.approx(61, abs=1)
+
+    # The next sample is due now but hasn't arrived: one quick retry
+    coordinator._sample_received -= 60
+    await coordinator.async_refresh()
+    assert coordinator.duplicate_samples == 1
+    assert coordinator.update_interval.total_seconds() == ALIGN_MIN_DELAY
+
+    # Still nothing after the retry: the device is late, back to the scan interval
+    coordinator._sample_received -= ALIGN_MIN_DELAY + 1
+    await coordinator.async_refresh()
+    assert coordinator.duplicate_samples == 2
+    assert coordinator.update_interval == SCAN_INTERVAL
+
+    # A new sample realigns
+    fake_devices.sensors = {"seq": 2, "interval": 60, "temperature": 21.0}
+    await coordinator.async_refresh()
+    assert coordinator.update_interval.total_seconds() == pytest.approx(61, abs=1)
+
+    # Without a reported interval the scan interval applies again
+    fake_devices.sensors = {"seq": 3, "temperature": 21.0}
+    await coordinator.async_refresh()
+    assert coordinator.update_interval == SCAN_INTERVAL
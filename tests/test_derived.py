@@ -0,0 +1,42 @@
+"""Tests for Athena derived metrics."""
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.athena import derived
+from custom_components.athena.derived import AthenaDerivedMetrics, dew_points, heat_indices
+
+POLL = 600
+
+
+def test_reference_values() -> None:
+    """Dew point and heat index match published reference values."""
+    # 20 °C at 50 % relative humidity condenses at about 9.3 °C
+    assert dew_points([20.0], [50.0]) == [pytest.approx(9.3, abs=0.1)]
+    # NWS heat index table: 90 °F at 70 % feels like 106 °F
+    assert heat_indices([(90 - 32) * 5 / 9], [70.0]) == [pytest.approx(41.1, abs=0.1)]
+    assert dew_points([20.0, None], [0.0, 50.0]) == [None, None]
+
+
+def test_pressure_trend_follows_the_window(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The trend settles once an old pressure step leaves the window."""
+    clock = SimpleNamespace(now=0.0)
+    monkeypatch.setattr(derived, "time", SimpleNamespace(monotonic=lambda: clock.now))
+    metrics = AthenaDerivedMetrics()
+
+    def poll(pressure: float) -> float | None:
+        data = {"pressure": pressure}
+        metrics.apply(data)
+        clock.now += POLL
+        return data["pressure_trend"]
+
+    assert poll(1000.0) is None
+    for _ in range(5):
+        poll(1000.0)
+    # A 10 hPa rise within the first hour extrapolates to 30 hPa per 3 hours
+    assert poll(1010.0) == 30.0
+    for _ in range(6 * 3600 // POLL):
+        trend = poll(1010.0)
+    assert trend == 0.0
@@ -0,0 +1,143 @@
+"""Tests for setting up and reloading Athena entries."""
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from homeassistant import config_entries
+from homeassistant.core import HomeAssistant
+
+from custom_components.athena.const import DOMAIN, PARKED_COORDINATORS
+from custom_components.athena.websocket import AthenaSubscription
+
+from .fake_device import FakeAthenaDevices
+
+
+async def test_reload_keeps_client_snapshot_and_desired_state(
+    hass: HomeAssistant, fake_devices: FakeAthenaDevices
+) -> None:
+    """A reload right after a settings change picks up where it left off."""
+    (port,) = await fake_devices.async_start(1)
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN,
+        context={"source": config_entries.SOURCE_USER},
+        data={
+            "host": "127.0.0.1",
+            "port": port,
+            "username": "admin",
+            "password": "admin",
+            "device_type": "controller",
+            "scan_interval": 30,
+        },
+    )
+    await hass.async_block_till_done()
+    entry = result["result"]
+    before = hass.data[DOMAIN][entry.entry_id]
+    await before.async_set_config({"threshold": 42})
+    polls = fake_devices.requests[("GET", "/api/sensors")]
+
+    # Reload before the desired state's delayed save has run
+    assert await hass.config_entries.async_reload(entry.entry_id)
+    await hass.async_block_till_done()
+    after = hass.data[DOMAIN][entry.entry_id]
+
+    assert after is not before
+    assert after.api is before.api
+    assert after.data is before.data
+    assert after.reconciler is before.reconciler
+    assert after.reconciler.desired == {"threshold": 42}
+    assert fake_devices.requests[("GET", "/api/sensors")] == polls
+
+
+async def test_remove_deletes_desired_state(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    fake_devices: FakeAthenaDevices,
+) -> None:
+    """Removing an entry leaves no desired-state file behind."""
+    (port,) = await fake_devices.async_start(1)
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN,
+        context={"source": config_entries.SOURCE_USER},
+        data={
+            "host": "127.0.0.1",
+            "port": port,
+            "username": "admin",
+            "password": "admin",
+            "device_type": "controller",
+            "scan_interval": 30,
+        },
+    )
+    await hass.async_block_till_done()
+    entry = result["result"]
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    await coordinator.async_set_config({"threshold": 42})
+    await coordinator.reconciler.async_flush()
+    key = f"{DOMAIN}.{entry.entry_id}.desired"
+    assert hass_storage[key]["data"] == {"threshold": 42}
+
+    await hass.config_entries.async_remove(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert key not in hass_storage
+    assert PARKED_COORDINATORS not in hass.data or not hass.data[PARKED_COORDINATORS]
+
+
+class _Connection:
+    """Collects the messages a websocket subscription sends."""
+
+    def __init__(self) -> None:
+        self.messages: list[dict[str, Any]] = []
+
+    def send_message(self, message: dict[str, Any]) -> None:
+        self.messages.append(message)
+
+
+@pytest.mark.parametrize("reconnect", [False, True])
+async def test_subscription_follows_reload(
+    hass: HomeAssistant, fake_devices: FakeAthenaDevices, reconnect: bool
+) -> None:
+    """Websocket subscribers keep getting updates after a reload, and can leave."""
+    fake_devices.sensors = {"temperature": 21.0}
+    (port,) = await fake_devices.async_start(1)
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN,
+        context={"source": config_entries.SOURCE_USER},
+        data={
+            "host": "127.0.0.1",
+            "port": port,
+            "username": "admin",
+            "password": "admin",
+            "device_type": "controller",
+            "scan_interval": 30,
+        },
+    )
+    await hass.async_block_till_done()
+    entry = result["result"]
+    before = hass.data[DOMAIN][entry.entry_id]
+    connection = _Connection()
+    subscription = AthenaSubscription(hass, connection, 1, ["temperature"], 0)
+    subscription.async_track(entry.entry_id, before)
+    subscription.async_flush()
+
+    if reconnect:
+        # New connection settings reload the entry with a fresh client
+        hass.config_entries.async_update_entry(entry, data={**entry.data, "password": "new"})
+    else:
+        assert await hass.config_entries.async_reload(entry.entry_id)
+    await hass.async_block_till_done()
+    after = hass.data[DOMAIN][entry.entry_id]
+    assert after is not before
+    assert (after.api is before.api) is not reconnect
+
+    fake_devices.sensors = {"temperature": 22.0}
+    await after.async_refresh()
+    subscription.async_unsubscribe()
+    fake_devices.sensors = {"temperature": 23.0}
+    await after.async_refresh()
+
+    assert [message["event"]["devices"] for message in connection.messages] == [
+        {entry.entry_id: {"temperature": 21.0}},
+        {entry.entry_id: {"temperature": 22.0}},
+    ]
@@ -0,0 +1,56 @@
+"""Tests for Athena desired-state reconciliation."""
+from __future__ import annotations
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.athena.api import AthenaAPIClient
+from custom_components.athena.reconcile import AthenaReconciler
+
+from .fake_device import FakeAthenaDevices
+
+
+async def test_changes_go_to_their_endpoints(
+    hass: HomeAssistant, fake_devices: FakeAthenaDevices
+) -> None:
+    """Threshold and interval share /api/config, mode and profile don't."""
+    (port,) = await fake_devices.async_start(1)
+    client = AthenaAPIClient("127.0.0.1", port, "admin", "admin")
+    reconciler = AthenaReconciler(hass, client, "entry")
+    try:
+        assert await reconciler.async_set(
+            {"threshold": 60, "interval": 30, "mode": "automatic", "profile": "eco"}
+        )
+    finally:
+        await client.close()
+
+    assert fake_devices.requests[("POST", "/api/config")] == 1
+    assert fake_devices.requests[("POST", "/api/mode")] == 1
+    assert fake_devices.requests[("POST", "/api/profile")] == 1
+
+
+async def test_backoff_grows_while_drift_persists(
+    hass: HomeAssistant, fake_devices: FakeAthenaDevices
+) -> None:
+    """A change the device acknowledges but ignores is not resent every poll."""
+    (port,) = await fake_devices.async_start(1)
+    client = AthenaAPIClient("127.0.0.1", port, "admin", "admin")
+    reconciler = AthenaReconciler(hass, client, "entry")
+    stale = {"mode": "manual"}
+    try:
+        assert await reconciler.async_set({"mode": "automatic"})
+        for _ in range(5):
+            reconciler.async_reconcile(stale)
+            await hass.async_block_till_done()
+        # The first apply holds off retries for several seconds
+        assert fake_devices.requests[("POST", "/api/mode")] == 1
+
+        reconciler._next_attempt = 0
+        reconciler.async_reconcile(stale)
+        await hass.async_block_till_done()
+        assert fake_devices.requests[("POST", "/api/mode")] == 2
+        assert reconciler._attempts == 2
+    finally:
+        await client.close()
+
+    reconciler.async_reconcile({"mode": "automatic"})
+    assert reconciler._attempts == 0
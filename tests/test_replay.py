@@ -0,0 +1,82 @@
+"""Replay a traffic capture through the Athena integration.
+
+Without arguments a short capture is recorded from a fake device first. To
+replay a capture taken in the field with the capture_traffic option, point
+``ATHENA_REPLAY_CAPTURE`` at the ``athena_capture_<entry id>.jsonl`` file;
+``ATHENA_REPLAY_SPEED`` sets how much faster than recorded it runs (default
+100).
+"""
+from __future__ import annotations
+
+import asyncio
+import os
+from pathlib import Path
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant
+
+from custom_components.athena.api import AthenaAPIClient
+from custom_components.athena.capture import (
+    AthenaReplayClient,
+    AthenaTrafficRecorder,
+    load_capture,
+)
+from custom_components.athena.const import DOMAIN, PENDING_CLIENTS
+
+from .fake_device import FakeAthenaDevices
+
+REPLAY_SPEED = float(os.environ.get("ATHENA_REPLAY_SPEED", 100))
+RECORDED_POLLS = 5
+
+
+async def _async_record_capture(fake_devices: FakeAthenaDevices, path: Path) -> None:
+    """Record a few polls and probes from a fake device."""
+    (port,) = await fake_devices.async_start(1)
+    client = AthenaAPIClient(
+        "127.0.0.1", port, "admin", "admin", recorder=AthenaTrafficRecorder(str(path))
+    )
+    try:
+        await client.get_device_info()
+        for _ in range(RECORDED_POLLS):
+            await client.probe(2)
+            await asyncio.gather(client.get_sensor_data(), client.get_status())
+            await asyncio.sleep(0.1)
+    finally:
+        await client.close()
+
+
+async def test_replay(
+    hass: HomeAssistant, fake_devices: FakeAthenaDevices, tmp_path: Path
+) -> None:
+    """Drive a coordinator from a capture at the recorded poll cadence."""
+    if (capture := os.environ.get("ATHENA_REPLAY_CAPTURE")) is None:
+        capture = str(tmp_path / "capture.jsonl")
+        await _async_record_capture(fake_devices, Path(capture))
+    exchanges = await hass.async_add_executor_job(load_capture, capture)
+    client = AthenaReplayClient(exchanges, REPLAY_SPEED)
+
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        unique_id="replay",
+        data={
+            "host": client.host,
+            "port": client.port,
+            "username": "",
+            "password": "",
+            "device_type": "controller",
+        },
+    )
+    entry.add_to_hass(hass)
+    # Setup picks the client up exactly like one the config flow validated
+    hass.data.setdefault(PENDING_CLIENTS, {})[entry.unique_id] = (client, {})
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    assert entry.state is ConfigEntryState.LOADED
+
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    await client.async_drive(coordinator)
+    await hass.async_block_till_done()
+
+    assert coordinator.last_update_success
+    assert coordinator.data
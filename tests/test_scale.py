@@ -0,0 +1,166 @@
+"""Load-scaling harness for the Athena integration.
+
+Sets up N simulated devices through the real config flow, ``async_setup_entry``
+and all five platforms, then measures:
+
+- setup wall time for all entries
+- resident memory added per entry
+- state writes per second during a steady-state window
+- event loop lag (p50/p99/max) during that window
+
+Results for every N are written to ``scale_report.json`` (override with
+``ATHENA_SCALE_REPORT``) so runs can be compared for scaling regressions. The
+steady-state window defaults to 30 seconds (``ATHENA_SCALE_WINDOW``).
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import platform
+import socket
+import statistics
+import time
+from collections.abc import Generator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from homeassistant import config_entries
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.data_entry_flow import FlowResultType
+from homeassistant.setup import async_setup_component
+
+from custom_components.athena.const import DOMAIN
+
+from .fake_device import FakeAthenaDevices
+
+SCAN_INTERVAL = 10
+WINDOW = float(os.environ.get("ATHENA_SCALE_WINDOW", 30))
+REPORT_PATH = os.environ.get("ATHENA_SCALE_REPORT", "scale_report.json")
+LAG_SAMPLE_INTERVAL = 0.05
+
+pytestmark = pytest.mark.scale
+
+
+@pytest.fixture(scope="module")
+def scale_report() -> Generator[list[dict[str, Any]]]:
+    """Collect results of every run and write them out at the end."""
+    results: list[dict[str, Any]] = []
+    yield results
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "scan_interval": SCAN_INTERVAL,
+        "window_s": WINDOW,
+        "results": results,
+    }
+    Path(REPORT_PATH).write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+
+
+def _free_port() -> int:
+    """Return a loopback port nothing is listening on."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _rss_bytes() -> int:
+    """Return the resident set size of this process."""
+    with open("/proc/self/statm", encoding="ascii") as file:
+        return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+def _percentile(samples: list[float], percent: float) -> float:
+    """Return a percentile of the samples, 0 when there are none."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(int(len(ordered) * percent / 100), len(ordered) - 1)]
+
+
+async def _async_measure_lag(stop: asyncio.Event, samples: list[float]) -> None:
+    """Record how late the event loop wakes a sleeping task."""
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        expected = loop.time() + LAG_SAMPLE_INTERVAL
+        await asyncio.sleep(LAG_SAMPLE_INTERVAL)
+        samples.append(max(loop.time() - expected, 0.0))
+
+
+@pytest.mark.parametrize("entries", [10, 100, 500])
+async def test_scale(
+    hass: HomeAssistant,
+    fake_devices: FakeAthenaDevices,
+    scale_report: list[dict[str, Any]],
+    entries: int,
+) -> None:
+    """Set up ``entries`` devices and measure setup cost and steady state."""
+    ports = await fake_devices.async_start(entries)
+    # websocket_api needs http; give it a free port instead of 8123
+    assert await async_setup_component(hass, "http", {"http": {"server_port": _free_port()}})
+    assert await async_setup_component(hass, DOMAIN, {})
+
+    rss_before = _rss_bytes()
+    started = time.perf_counter()
+    results = await asyncio.gather(
+        *(
+            hass.config_entries.flow.async_init(
+                DOMAIN,
+                context={"source": config_entries.SOURCE_USER},
+                data={
+                    "host": "127.0.0.1",
+                    "port": port,
+                    "username": "admin",
+                    "password": "admin",
+                    "device_type": "controller",
+                    "scan_interval": SCAN_INTERVAL,
+                },
+            )
+            for port in ports
+        )
+    )
+    await hass.async_block_till_done()
+    setup_time = time.perf_counter() - started
+    rss_after = _rss_bytes()
+
+    assert all(result["type"] is FlowResultType.CREATE_ENTRY for result in results)
+    loaded = [
+        entry
+        for entry in hass.config_entries.async_entries(DOMAIN)
+        if entry.state is config_entries.ConfigEntryState.LOADED
+    ]
+    assert len(loaded) == entries
+
+    state_writes = 0
+
+    @callback
+    def _count_state_write(_event: Event) -> None:
+        nonlocal state_writes
+        state_writes += 1
+
+    unsub = hass.bus.async_listen(EVENT_STATE_CHANGED, _count_state_write)
+    lag: list[float] = []
+    stop = asyncio.Event()
+    lag_task = hass.async_create_task(_async_measure_lag(stop, lag))
+    await asyncio.sleep(WINDOW)
+    stop.set()
+    await lag_task
+    unsub()
+
+    scale_report.append(
+        {
+            "entries": entries,
+            "entities": len(hass.states.async_all()),
+            "setup_wall_time_s": round(setup_time, 3),
+            "setup_per_entry_ms": round(setup_time / entries * 1000, 3),
+            "memory_per_entry_kib": round((rss_after - rss_before) / entries / 1024, 1),
+            "state_writes_per_s": round(state_writes / WINDOW, 2),
+            "loop_lag_p50_ms": round(_percentile(lag, 50) * 1000, 2),
+            "loop_lag_p99_ms": round(_percentile(lag, 99) * 1000, 2),
+            "loop_lag_max_ms": round(max(lag, default=0.0) * 1000, 2),
+            "loop_lag_mean_ms": round(statistics.fmean(lag) * 1000, 2) if lag else 0.0,
+        }
+    )